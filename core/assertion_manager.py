@@ -3,7 +3,6 @@ import json
 import time
 from typing import Dict, List, Optional, Tuple, Any
 from concurrent.futures import ThreadPoolExecutor
-from functools import lru_cache
 from appium import webdriver
 from appium.webdriver.common.appiumby import AppiumBy
 from selenium.webdriver.support.ui import WebDriverWait
@@ -19,6 +18,7 @@ class AssertionManager:
         """
         self.config = config
         self.assertions = {}
+        self._assertion_index: Dict[Tuple[str, str], Dict] = {}  # (模块, 断言名称) -> 断言
         self._executor = ThreadPoolExecutor(max_workers=4)
         self.load_assertions()
     
@@ -45,13 +45,13 @@ class AssertionManager:
         :return: 断言数据或None
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                assertion = json.load(f)
-                if self._validate_assertion(assertion):
-                    return assertion
-                else:
-                    logger.warning(f"断言格式无效: {file_path}")
-                    return None
+            with open(file_path, 'rb') as f:
+                assertion = json.loads(f.read())
+            if self._validate_assertion(assertion):
+                return assertion
+            else:
+                logger.warning(f"断言格式无效: {file_path}")
+                return None
         except json.JSONDecodeError as e:
             logger.error(f"JSON解析失败 {file_path}: {e}")
             return None
@@ -70,16 +70,18 @@ class AssertionManager:
                 return
             
             # 遍历所有模块目录
-            for module in os.listdir(assert_dir):
-                module_path = os.path.join(assert_dir, module)
-                if os.path.isdir(module_path):
+            with os.scandir(assert_dir) as modules:
+                for module_entry in modules:
+                    if not module_entry.is_dir():
+                        continue
+                    module = module_entry.name
                     self.assertions[module] = []
                     # 并行加载模块下的所有断言文件
-                    assertion_files = [
-                        os.path.join(module_path, f)
-                        for f in os.listdir(module_path)
-                        if f.endswith('.json')
-                    ]
+                    with os.scandir(module_entry.path) as entries:
+                        assertion_files = [
+                            entry.path for entry in entries
+                            if entry.name.endswith('.json')
+                        ]
                     
                     # 使用线程池并行加载
                     futures = [
@@ -91,7 +93,9 @@ class AssertionManager:
                     for future in futures:
                         assertion = future.result()
                         if assertion:
+                            assertion.setdefault('module', module)
                             self.assertions[module].append(assertion)
+                            self._assertion_index[(module, assertion['name'])] = assertion
             
             logger.info(f"断言加载完成，共加载 {sum(len(assertions) for assertions in self.assertions.values())} 个断言")
         
@@ -133,6 +137,7 @@ class AssertionManager:
             # 准备断言数据
             assertion = {
                 'name': name,
+                'module': module,
                 'description': description,
                 'locator_type': locator_type,
                 'locator_value': locator_value,
@@ -159,9 +164,7 @@ class AssertionManager:
             if module not in self.assertions:
                 self.assertions[module] = []
             self.assertions[module].append(assertion)
-            
-            # 清除缓存
-            self.get_assertion.cache_clear()
+            self._assertion_index[(module, name)] = assertion
             
             logger.info(f"断言创建成功: {file_path}")
             return True
@@ -170,7 +173,6 @@ class AssertionManager:
             logger.error(f"创建断言失败: {e}")
             return False
     
-    @lru_cache(maxsize=128)
     def get_assertion(self, module: str, name: str) -> Optional[Dict]:
         """
         获取指定的断言
@@ -178,16 +180,11 @@ class AssertionManager:
         :param name: 断言名称
         :return: 断言数据或None
         """
-        try:
-            assertions = self.assertions.get(module, [])
-            return next((a for a in assertions if a['name'] == name), None)
-        except Exception as e:
-            logger.error(f"获取断言失败: {e}")
-            return None
+        return self._assertion_index.get((module, name))
     
     def update_assertion(self, module: str, name: str, updates: Dict) -> bool:
         """
-        更新断言
+        更新断言，更新内容中的module/name不同时会移动或重命名断言
         :param module: 模块名称
         :param name: 断言名称
         :param updates: 更新的内容
@@ -204,32 +201,58 @@ class AssertionManager:
             if invalid_fields:
                 raise ValueError(f"无效的更新字段: {invalid_fields}")
             
-            # 更新断言内容
-            assertion.update(updates)
-            assertion['updated_at'] = time.strftime('%Y-%m-%d %H:%M:%S')
+            new_module = updates.get('module', module)
+            new_name = updates.get('name', name)
+            if (new_module, new_name) != (module, name) and self.get_assertion(new_module, new_name):
+                raise ValueError(f"断言已存在: {new_module}/{new_name}")
+            
+            # 先生成更新后的断言，写入文件成功后再替换内存数据
+            updated = dict(assertion)
+            updated.update(updates)
+            updated['updated_at'] = time.strftime('%Y-%m-%d %H:%M:%S')
             
             # 保存到文件
-            module_dir = os.path.join(self.config['assert']['save_dir'], module)
-            for filename in os.listdir(module_dir):
-                if filename.endswith('.json'):
-                    file_path = os.path.join(module_dir, filename)
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        current_assertion = json.load(f)
-                        if current_assertion['name'] == name:
-                            with open(file_path, 'w', encoding='utf-8') as f:
-                                json.dump(assertion, f, ensure_ascii=False, indent=2)
-                            
-                            # 更新内存中的断言
-                            for i, a in enumerate(self.assertions[module]):
-                                if a['name'] == name:
-                                    self.assertions[module][i] = assertion
-                                    break
-                            
-                            # 清除缓存
-                            self.get_assertion.cache_clear()
-                            
-                            logger.info(f"断言已更新: {file_path}")
-                            return True
+            save_dir = self.config['assert']['save_dir']
+            module_dir = os.path.join(save_dir, module)
+            with os.scandir(module_dir) as it:
+                entries = list(it)
+            for entry in entries:
+                if entry.name.endswith('.json'):
+                    file_path = entry.path
+                    with open(file_path, 'rb') as f:
+                        current_assertion = json.loads(f.read())
+                    if current_assertion['name'] != name:
+                        continue
+                    
+                    # 模块变化时写入新模块目录并删除原文件
+                    target_path = file_path
+                    if new_module != module:
+                        target_dir = os.path.join(save_dir, new_module)
+                        os.makedirs(target_dir, exist_ok=True)
+                        target_path = os.path.join(target_dir, entry.name)
+                    
+                    with open(target_path, 'w', encoding='utf-8') as f:
+                        json.dump(updated, f, ensure_ascii=False, indent=2)
+                    if target_path != file_path:
+                        os.remove(file_path)
+                    
+                    # 更新内存中的断言
+                    if new_module == module:
+                        for i, a in enumerate(self.assertions[module]):
+                            if a['name'] == name:
+                                self.assertions[module][i] = updated
+                                break
+                    else:
+                        self.assertions[module] = [
+                            a for a in self.assertions[module]
+                            if a['name'] != name
+                        ]
+                        self.assertions.setdefault(new_module, []).append(updated)
+                    self._assertion_index.pop((module, name), None)
+                    self._assertion_index[(new_module, new_name)] = updated
+                    
+                    logger.info(f"断言已更新: {target_path}")
+                    return True
             
             raise FileNotFoundError(f"未找到断言文件: {module}/{name}")
         
@@ -250,16 +273,18 @@ class AssertionManager:
                 raise FileNotFoundError(f"未找到断言: {module}/{name}")
             
             module_dir = os.path.join(self.config['assert']['save_dir'], module)
-            for filename in os.listdir(module_dir):
-                if filename.endswith('.json'):
-                    file_path = os.path.join(module_dir, filename)
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
+            with os.scandir(module_dir) as it:
+                entries = list(it)
+            for entry in entries:
+                if entry.name.endswith('.json'):
+                    file_path = entry.path
+                    with open(file_path, 'rb') as f:
+                        data = json.loads(f.read())
                         if data['name'] == name:
                             # 创建备份
                             backup_dir = os.path.join(self.config['assert']['save_dir'], '_deleted')
                             os.makedirs(backup_dir, exist_ok=True)
-                            backup_path = os.path.join(backup_dir, f"{module}_{filename}")
+                            backup_path = os.path.join(backup_dir, f"{module}_{entry.name}")
                             os.rename(file_path, backup_path)
                             
                             # 从内存中移除
@@ -267,9 +292,7 @@ class AssertionManager:
                                 a for a in self.assertions[module]
                                 if a['name'] != name
                             ]
-                            
-                            # 清除缓存
-                            self.get_assertion.cache_clear()
+                            self._assertion_index.pop((module, name), None)
                             
                             logger.info(f"断言已删除并备份: {backup_path}")
                             return True
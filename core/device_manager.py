@@ -68,6 +68,7 @@ class DeviceManager:
         self._platform = "android"
         self._devices_cache = {}
         self._cache_time = 0
+        self._cache_generation = 0  # 每次清除缓存时递增，用于丢弃清除前开始的枚举结果
         self._cache_lock = threading.Lock()
         self._appium_servers = {}
         self._server_lock = threading.Lock()
@@ -95,6 +96,7 @@ class DeviceManager:
         with self._cache_lock:
             self._devices_cache.clear()
             self._cache_time = 0
+            self._cache_generation += 1
     
     def get_device_info(self, device_id: str) -> Optional[Dict]:
         """获取设备信息"""
@@ -131,17 +133,19 @@ class DeviceManager:
         current_time = time.time()
         
         with self._cache_lock:
-            # 检查缓存是否有效
-            if (current_time - self._cache_time) < self._cache_timeout and self._devices_cache:
+            # 检查缓存是否有效，没有设备的结果同样缓存，避免无设备时每次都重新枚举
+            if (current_time - self._cache_time) < self._cache_timeout:
                 return list(self._devices_cache.values())
+            generation = self._cache_generation
         
         try:
             devices = self._get_devices_internal()
             
-            # 更新缓存
+            # 更新缓存；枚举期间缓存被清除（切换平台、连接或断开设备）时结果可能已过期，不写入缓存
             with self._cache_lock:
-                self._devices_cache = {d['id']: d for d in devices}
-                self._cache_time = current_time
+                if generation == self._cache_generation:
+                    self._devices_cache = {d['id']: d for d in devices}
+                    self._cache_time = current_time
             
             return devices
         
@@ -262,29 +266,28 @@ class DeviceManager:
         try:
             logger.info(f"正在停止Appium服务器: 端口 {port}")
             
+            # 只在取出服务器记录时持有锁，等待进程退出期间不持锁，
+            # 否则同一事件循环中并发停止多个服务器时会在锁上互相阻塞
             with self._server_lock:
-                server_info = self._appium_servers.get(port)
-                if not server_info:
-                    logger.warning(f"未找到端口 {port} 对应的Appium服务器")
-                    return
-                
-                process = server_info['process']
-                
-                # 尝试优雅关闭
+                server_info = self._appium_servers.pop(port, None)
+            if not server_info:
+                logger.warning(f"未找到端口 {port} 对应的Appium服务器")
+                return
+            
+            process = server_info['process']
+            
+            # 尝试优雅关闭
+            try:
+                process.terminate()
                 try:
-                    process.terminate()
-                    try:
-                        await asyncio.wait_for(process.wait(), timeout=5.0)
-                        logger.info(f"Appium服务器已优雅关闭: 端口 {port}")
-                    except asyncio.TimeoutError:
-                        logger.warning(f"Appium服务器优雅关闭超时，强制终止: 端口 {port}")
-                        await self._kill_process(process)
-                except Exception as e:
-                    logger.warning(f"关闭Appium服务器过程中出现错误: {e}")
+                    await asyncio.wait_for(process.wait(), timeout=5.0)
+                    logger.info(f"Appium服务器已优雅关闭: 端口 {port}")
+                except asyncio.TimeoutError:
+                    logger.warning(f"Appium服务器优雅关闭超时，强制终止: 端口 {port}")
                     await self._kill_process(process)
-                
-                # 清理服务器记录
-                del self._appium_servers[port]
+            except Exception as e:
+                logger.warning(f"关闭Appium服务器过程中出现错误: {e}")
+                await self._kill_process(process)
             
         except Exception as e:
             logger.error(f"停止Appium服务器失败: {e}")
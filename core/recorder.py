@@ -1,10 +1,11 @@
 import os
+import sys
 import time
 import json
 import asyncio
 import threading
+import weakref
 from queue import Queue, Empty
-from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple, Any
 from appium import webdriver
 from appium.webdriver.common.appiumby import AppiumBy
@@ -29,11 +30,13 @@ class ActionRecorder:
         """
         self.device_info = device_info
         self.config = config
-        self.driver = None
+        self._driver_box = [None]  # 与 finalizer 共享的 WebDriver 引用
+        self._finalizer = weakref.finalize(
+            self, ActionRecorder._safe_driver_quit, self._driver_box
+        )
         self.recording = False
         self.actions = []
         self._action_queue = Queue()
-        self._executor = ThreadPoolExecutor(max_workers=2)
         self._record_thread = None
         self._process_thread = None
         self._stop_event = threading.Event()
@@ -48,11 +51,44 @@ class ActionRecorder:
         self.last_action_time = None
         self.current_activity = None  # 当前Activity（Android）
         self.current_window = None    # 当前Window（iOS）
+        self._last_state_key = None   # 上一次的界面标识
         self._error_count = 0
         self._max_errors = config.get('max_errors', 5)
         
+        # 缓存当前平台的应用信息
+        platform = self.device_info.get('platform', '')
+        dev_cfg = (self.config.get('devices', {}).get(platform, [{}]) or [{}])[0] or {}
+        self._app_info = {
+            'package': dev_cfg.get('app_package', ''),
+            'activity': dev_cfg.get('app_activity', ''),
+            'bundle_id': dev_cfg.get('bundle_id', '')
+        }
+        
         logger.info("录制器初始化完成")
     
+    @property
+    def driver(self):
+        """当前 WebDriver 实例"""
+        return self._driver_box[0]
+    
+    @driver.setter
+    def driver(self, value):
+        self._driver_box[0] = value
+    
+    @staticmethod
+    def _safe_driver_quit(driver_box: List) -> None:
+        """录制器被回收时关闭残留的 WebDriver（不依赖 logger，解释器退出时也可安全执行）"""
+        driver, driver_box[0] = driver_box[0], None
+        if driver is None:
+            return
+        try:
+            driver.quit()
+        except Exception as e:
+            try:
+                sys.stderr.write(f"关闭WebDriver失败: {e}\n")
+            except Exception:
+                pass
+    
     def _get_android_caps(self) -> Dict:
         """
         获取Android设备的Capabilities配置
@@ -144,8 +180,8 @@ class ActionRecorder:
             self._reset_state()
             
             # 启动录制
-            success = await asyncio.get_event_loop().run_in_executor(
-                self._executor,
+            success = await asyncio.get_running_loop().run_in_executor(
+                None,
                 self._start_recording_sync
             )
             
@@ -197,8 +233,8 @@ class ActionRecorder:
             self._process_remaining_actions()
             
             # 停止WebDriver
-            await asyncio.get_event_loop().run_in_executor(
-                self._executor,
+            await asyncio.get_running_loop().run_in_executor(
+                None,
                 self._stop_recording_sync
             )
             
@@ -216,16 +252,22 @@ class ActionRecorder:
         self.actions = []
         self._stop_event.clear()
         self._error_count = 0
+        self._last_state_key = None
         self._last_action_time = time.time()
         self.start_time = time.time()
         self.last_action_time = self.start_time
         
         # 清空队列
-        while not self._action_queue.empty():
-            try:
-                self._action_queue.get_nowait()
-            except Empty:
-                break
+        self._drain_queue()
+    
+    def _drain_queue(self) -> List[Dict]:
+        """一次性取出队列中的全部动作（只加一次锁）"""
+        q = self._action_queue
+        with q.mutex:
+            items = list(q.queue)
+            q.queue.clear()
+            q.not_full.notify_all()
+        return items
     
     def _cleanup(self):
         """清理资源"""
@@ -243,11 +285,7 @@ class ActionRecorder:
                     self.driver = None
             
             # 清空队列
-            while not self._action_queue.empty():
-                try:
-                    self._action_queue.get_nowait()
-                except Empty:
-                    break
+            self._drain_queue()
             
             logger.info("录制器资源已清理")
         
@@ -259,8 +297,17 @@ class ActionRecorder:
         try:
             while not self._stop_event.is_set():
                 try:
+                    # 先获取轻量的界面标识，未变化时跳过页面源码拉取
+                    identity = self._get_identity_fast()
+                    state_key = self._state_key(identity)
+                    if identity and state_key == self._last_state_key:
+                        time.sleep(self.config.get('record_interval', 0.5))
+                        continue
+                    self._last_state_key = state_key
+                    
                     # 获取当前界面状态
-                    current_state = self._get_current_state()
+                    current_state = dict(identity)
+                    current_state.update(self._get_source_state())
                     
                     # 检测变化并记录动作
                     if self._should_record_action(current_state):
@@ -351,6 +398,7 @@ class ActionRecorder:
         
         try:
             optimized = []
+            last_copied = False  # optimized[-1] 是否已是合并用的副本
             for action in actions:
                 if not optimized:
                     optimized.append(action)
@@ -358,9 +406,14 @@ class ActionRecorder:
                 
                 # 尝试合并动作
                 if self._can_merge_actions(optimized[-1], action):
-                    optimized[-1] = self._merge_actions(optimized[-1], action)
+                    # 首次合并前复制一份，不修改调用方的动作，出错时可原样返回输入
+                    if not last_copied:
+                        optimized[-1] = optimized[-1].copy()
+                        last_copied = True
+                    self._merge_actions_inplace(optimized[-1], action)
                 else:
                     optimized.append(action)
+                    last_copied = False
             
             return optimized
         
@@ -370,85 +423,66 @@ class ActionRecorder:
     
     def _can_merge_actions(self, action1: Dict, action2: Dict) -> bool:
         """判断两个动作是否可以合并"""
-        try:
-            # 相同类型的动作
-            if action1.get('type') != action2.get('type'):
-                return False
-            
-            # 时间间隔小于阈值
-            time_gap = action2.get('timestamp', 0) - action1.get('timestamp', 0)
-            if time_gap > self.config.get('merge_threshold', 0.5):
-                return False
-            
-            # 特定类型的动作合并规则
-            action_type = action1.get('type')
-            if action_type == ActionType.CLICK.value:
-                # 相同位置的点击
-                return (
-                    abs(action1.get('x', 0) - action2.get('x', 0)) < 5 and
-                    abs(action1.get('y', 0) - action2.get('y', 0)) < 5
-                )
-            elif action_type == ActionType.INPUT.value:
-                # 连续的输入
-                return True
-            elif action_type == ActionType.SWIPE.value:
-                # 相似的滑动
-                return (
-                    abs(action1.get('start_x', 0) - action2.get('start_x', 0)) < 10 and
-                    abs(action1.get('start_y', 0) - action2.get('start_y', 0)) < 10 and
-                    abs(action1.get('end_x', 0) - action2.get('end_x', 0)) < 10 and
-                    abs(action1.get('end_y', 0) - action2.get('end_y', 0)) < 10
-                )
-            
+        # 相同类型的动作
+        if action1.get('type') != action2.get('type'):
             return False
         
-        except Exception as e:
-            logger.error(f"判断动作是否可合并时发生错误: {e}")
+        # 时间间隔小于阈值
+        time_gap = action2.get('timestamp', 0) - action1.get('timestamp', 0)
+        if time_gap > self.config.get('merge_threshold', 0.5):
             return False
+        
+        # 特定类型的动作合并规则
+        action_type = action1.get('type')
+        if action_type == ActionType.CLICK.value:
+            # 相同位置的点击
+            return (
+                abs(action1.get('x', 0) - action2.get('x', 0)) < 5 and
+                abs(action1.get('y', 0) - action2.get('y', 0)) < 5
+            )
+        elif action_type == ActionType.INPUT.value:
+            # 连续的输入
+            return True
+        elif action_type == ActionType.SWIPE.value:
+            # 相似的滑动
+            return (
+                abs(action1.get('start_x', 0) - action2.get('start_x', 0)) < 10 and
+                abs(action1.get('start_y', 0) - action2.get('start_y', 0)) < 10 and
+                abs(action1.get('end_x', 0) - action2.get('end_x', 0)) < 10 and
+                abs(action1.get('end_y', 0) - action2.get('end_y', 0)) < 10
+            )
+        
+        return False
     
-    def _merge_actions(self, action1: Dict, action2: Dict) -> Dict:
-        """合并两个动作"""
-        try:
-            merged = action1.copy()
-            
-            # 更新时间戳
-            merged['timestamp'] = action2.get('timestamp', 0)
-            merged['time_gap'] = action2.get('time_gap', 0)
-            
-            # 特定类型的动作合并逻辑
-            action_type = action1.get('type')
-            if action_type == ActionType.CLICK.value:
-                # 增加点击次数
-                merged['clicks'] = merged.get('clicks', 1) + 1
-            elif action_type == ActionType.INPUT.value:
-                # 合并输入文本
-                merged['text'] = merged.get('text', '') + action2.get('text', '')
-            elif action_type == ActionType.SWIPE.value:
-                # 使用最新的坐标
-                merged.update({
-                    'start_x': action2.get('start_x', 0),
-                    'start_y': action2.get('start_y', 0),
-                    'end_x': action2.get('end_x', 0),
-                    'end_y': action2.get('end_y', 0)
-                })
-            
-            return merged
+    def _merge_actions_inplace(self, action1: Dict, action2: Dict) -> Dict:
+        """将 action2 原地合并到 action1 并返回 action1"""
+        # 更新时间戳
+        action1['timestamp'] = action2.get('timestamp', 0)
+        action1['time_gap'] = action2.get('time_gap', 0)
         
-        except Exception as e:
-            logger.error(f"合并动作失败: {e}")
-            return action1
+        # 特定类型的动作合并逻辑
+        action_type = action1.get('type')
+        if action_type == ActionType.CLICK.value:
+            # 增加点击次数
+            action1['clicks'] = action1.get('clicks', 1) + 1
+        elif action_type == ActionType.INPUT.value:
+            # 合并输入文本
+            action1['text'] = action1.get('text', '') + action2.get('text', '')
+        elif action_type == ActionType.SWIPE.value:
+            # 使用最新的坐标
+            action1.update({
+                'start_x': action2.get('start_x', 0),
+                'start_y': action2.get('start_y', 0),
+                'end_x': action2.get('end_x', 0),
+                'end_y': action2.get('end_y', 0)
+            })
+        
+        return action1
     
     def _process_remaining_actions(self):
         """处理剩余的动作"""
         try:
-            remaining = []
-            while not self._action_queue.empty():
-                try:
-                    action = self._action_queue.get_nowait()
-                    if action:
-                        remaining.append(action)
-                except Empty:
-                    break
+            remaining = [action for action in self._drain_queue() if action]
             
             if remaining:
                 self._process_batch(remaining)
@@ -456,91 +490,83 @@ class ActionRecorder:
         except Exception as e:
             logger.error(f"处理剩余动作失败: {e}")
     
-    def _get_current_state(self) -> Dict:
-        """获取当前界面状态"""
+    def _get_identity_fast(self) -> Dict:
+        """获取界面标识（Activity/Package 或 Window/Context），不拉取页面源码"""
+        if not self.driver:
+            return {}
+        
         try:
-            if not self.driver:
-                return {}
-            
-            state = {}
-            
-            # 获取平台特定信息
-            try:
-                if self.device_info['platform'] == 'android':
-                    state.update({
-                        'activity': self.driver.current_activity,
-                        'package': self.driver.current_package
-                    })
-                else:
-                    state.update({
-                        'window': self.driver.current_window_handle,
-                        'context': self.driver.current_context
-                    })
-            except WebDriverException:
-                pass
-            
-            # 获取界面元素
-            try:
-                source = self.driver.page_source
-                state['source_hash'] = hash(source)
-            except WebDriverException:
-                pass
-            
-            # 获取屏幕方向
-            try:
-                state['orientation'] = self.driver.orientation
-            except WebDriverException:
-                pass
-            
+            if self.device_info['platform'] == 'android':
+                return {
+                    'activity': self.driver.current_activity,
+                    'package': self.driver.current_package
+                }
+            return {
+                'window': self.driver.current_window_handle,
+                'context': self.driver.current_context
+            }
+        except WebDriverException:
+            return {}
+    
+    def _get_source_state(self) -> Dict:
+        """获取界面源码哈希与屏幕方向"""
+        state = {}
+        if not self.driver:
             return state
         
-        except Exception as e:
-            logger.error(f"获取当前状态失败: {e}")
-            return {}
+        # 获取界面元素
+        try:
+            source = self.driver.page_source
+            state['source_hash'] = hash(source)
+        except WebDriverException:
+            pass
+        
+        # 获取屏幕方向
+        try:
+            state['orientation'] = self.driver.orientation
+        except WebDriverException:
+            pass
+        
+        return state
+    
+    @staticmethod
+    def _state_key(identity: Dict) -> Tuple:
+        """由界面标识生成比较用的键"""
+        return tuple(sorted(identity.items()))
     
     def _should_record_action(self, current_state: Dict) -> bool:
         """判断是否应该记录动作"""
-        try:
-            if not current_state:
-                return False
-            
-            # 检查状态变化
-            if self.current_activity != current_state.get('activity'):
-                return True
-            if self.current_window != current_state.get('window'):
-                return True
-            
-            # 检查时间间隔
-            current_time = time.time()
-            if current_time - self._last_action_time >= self.config.get('min_action_interval', 0.1):
-                return True
-            
+        if not current_state:
             return False
         
-        except Exception as e:
-            logger.error(f"判断是否应该记录动作时发生错误: {e}")
-            return False
+        # 检查状态变化
+        if self.current_activity != current_state.get('activity'):
+            return True
+        if self.current_window != current_state.get('window'):
+            return True
+        
+        # 检查时间间隔
+        current_time = time.time()
+        if current_time - self._last_action_time >= self.config.get('min_action_interval', 0.1):
+            return True
+        
+        return False
     
     def _create_action(self, current_state: Dict) -> Optional[Dict]:
         """创建动作"""
-        try:
-            if not current_state:
-                return None
-            
-            current_time = time.time()
-            action = {
-                'type': ActionType.STATE_CHANGE.value,
-                'timestamp': current_time,
-                'time_gap': current_time - self._last_action_time,
-                'state': current_state
-            }
-            
-            self._last_action_time = current_time
-            return action
-        
-        except Exception as e:
-            logger.error(f"创建动作失败: {e}")
+        if not current_state:
             return None
+        
+        current_time = time.time()
+        action = {
+            'type': ActionType.STATE_CHANGE.value,
+            'timestamp': current_time,
+            'time_gap': current_time - self._last_action_time,
+            'state': current_state
+        }
+        
+        self._last_action_time = current_time
+        return action
     
     def save_recording(self, module: str, name: str, description: str = "") -> bool:
         """保存录制结果"""
@@ -564,20 +590,23 @@ class ActionRecorder:
                     'platform_version': self.device_info['platform_version'],
                     'model': self.device_info.get('model', 'Unknown')
                 },
-                'app_info': {
-                    'package': self.config['devices'][self.device_info['platform']][0].get('app_package', ''),
-                    'activity': self.config['devices'][self.device_info['platform']][0].get('app_activity', ''),
-                    'bundle_id': self.config['devices'][self.device_info['platform']][0].get('bundle_id', '')
-                },
+                'app_info': dict(self._app_info),
                 'created_at': time.strftime('%Y-%m-%d %H:%M:%S'),
                 'duration': time.time() - self.start_time,
                 'action_count': len(self.actions),
                 'actions': self.actions
             }
             
-            # 保存到文件
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            # 先写临时文件再原子替换，避免中途崩溃留下残缺文件
+            tmp_path = filepath + '.tmp'
+            try:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
+                os.replace(tmp_path, filepath)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
             
             logger.info(f"录制结果已保存: {filepath}")
             return True
@@ -585,7 +614,3 @@ class ActionRecorder:
         except Exception as e:
             logger.error(f"保存录制结果失败: {e}")
             return False
-    
-    def __del__(self):
-        """析构函数"""
-        self._cleanup() 
\ No newline at end of file
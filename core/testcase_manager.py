@@ -1,10 +1,122 @@
 import os
 import json
+import heapq
+import mmap
 import time
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 from loguru import logger
 from concurrent.futures import ThreadPoolExecutor
-from functools import lru_cache
+from operator import itemgetter
+
+try:
+    import orjson
+except ImportError:  # 未安装 orjson 时退回标准库 json
+    orjson = None
+
+# 测试用例必填字段
+_REQUIRED_FIELDS = frozenset({'name', 'description', 'module', 'steps', 'assertions'})
+# 大于该大小的用例文件通过 mmap 直接交给解析器，避免 read() 拷贝
+MMAP_MIN_SIZE = 64 * 1024
+# 大于该大小的报告通过 mmap 写入，小文件直接 write() 更快
+MMAP_WRITE_MIN_SIZE = 1024 * 1024
+
+
+def _json_loads(data: bytes):
+    """解析 JSON 字节串"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj, pretty: bool = False) -> bytes:
+    """序列化为 UTF-8 编码的 JSON 字节串，默认输出紧凑格式"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if pretty:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _load_json_path(file_path: str):
+    """读取并解析 JSON 文件，大文件使用 mmap"""
+    with open(file_path, 'rb') as f:
+        # mmap 不支持空文件；标准库 json 无法直接解析 mmap，只在 orjson 可用时启用
+        if orjson is not None and os.fstat(f.fileno()).st_size >= MMAP_MIN_SIZE:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+        return _json_loads(f.read())
+
+
+def _write_bytes_path(file_path: str, data: bytes) -> None:
+    """写入字节数据，大文件使用预分配大小的 mmap"""
+    if len(data) < MMAP_WRITE_MIN_SIZE:
+        with open(file_path, 'wb') as f:
+            f.write(data)
+        return
+    
+    fd = os.open(file_path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.ftruncate(fd, len(data))
+        with mmap.mmap(fd, len(data)) as mm:
+            mm[:] = data
+    finally:
+        os.close(fd)
+
+
+# generate_test_code 使用的代码模板（已包含整体缩进）
+_CODE_HEADER_TMPL = (
+    "    import pytest\n"
+    "    from appium import webdriver\n"
+    "    from appium.webdriver.common.appiumby import AppiumBy\n"
+    "    from selenium.webdriver.support.ui import WebDriverWait\n"
+    "    from selenium.webdriver.support import expected_conditions as EC\n"
+    "    from selenium.common.exceptions import TimeoutException\n"
+    "    import time\n"
+    "\n"
+    "    def test_{func_name}(driver):\n"
+    "        try:\n"
+    "            wait = WebDriverWait(driver, 10)"
+)
+_OPERATION_STEP_TMPL = (
+    "            # 步骤 {i}: {desc}\n"
+    "            try:\n"
+    "                {code}\n"
+    "            except TimeoutException:\n"
+    "                logger.error(f'步骤 {i} 超时: {desc}')\n"
+    "                return False\n"
+    "            except Exception as e:\n"
+    "                logger.error(f'步骤 {i} 失败: {{e}}')\n"
+    "                return False"
+)
+_CASE_STEP_TMPL = (
+    "            # 步骤 {i}: 执行测试用例 {name}\n"
+    "            if not test_{func_name}(driver):\n"
+    "                logger.error('子用例执行失败: {name}')\n"
+    "                return False"
+)
+_ASSERTION_TMPL = (
+    "            # 断言 {i}: {desc}\n"
+    "            try:\n"
+    "                {code}\n"
+    "            except AssertionError:\n"
+    "                logger.error(f'断言 {i} 失败: {desc}')\n"
+    "                return False\n"
+    "            except Exception as e:\n"
+    "                logger.error(f'断言 {i} 执行异常: {{e}}')\n"
+    "                return False"
+)
+_CODE_FOOTER = (
+    "            logger.info('测试用例执行成功')\n"
+    "            return True\n"
+    "        except Exception as e:\n"
+    "            logger.error(f'测试执行失败: {e}')\n"
+    "            return False"
+)
+
 
 class TestCaseManager:
     def __init__(self, config: Dict):
@@ -13,8 +125,9 @@ class TestCaseManager:
         :param config: 配置信息
         """
         self.config = config
-        self.test_cases = {}
-        self._executor = ThreadPoolExecutor(max_workers=4)  # 用于并行处理
+        self.test_cases: Dict[str, Dict[str, Dict]] = {}  # 模块 -> 用例名称 -> 用例
+        self._pretty_json = config.get('test', {}).get('pretty_json', False)  # 是否缩进输出JSON
+        self._case_files: Dict[Tuple[str, str], str] = {}  # (模块, 用例名称) -> 文件路径
         self.load_test_cases()
     
     @staticmethod
@@ -24,23 +137,21 @@ class TestCaseManager:
         :param test_case: 测试用例数据
         :return: 是否有效
         """
-        required_fields = ['name', 'description', 'module', 'steps', 'assertions']
-        return all(field in test_case for field in required_fields)
+        return isinstance(test_case, dict) and _REQUIRED_FIELDS <= test_case.keys()
     
-    def _load_single_case(self, file_path: str) -> Optional[Dict]:
+    def _load_single_case(self, file_path: str) -> Optional[Tuple[str, Dict]]:
         """
         加载单个测试用例文件
         :param file_path: 文件路径
-        :return: 测试用例数据或None
+        :return: (文件路径, 测试用例数据)或None
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                test_case = json.load(f)
-                if self._validate_test_case(test_case):
-                    return test_case
-                else:
-                    logger.warning(f"测试用例格式无效: {file_path}")
-                    return None
+            test_case = _load_json_path(file_path)
+            if self._validate_test_case(test_case):
+                return file_path, test_case
+            else:
+                logger.warning(f"测试用例格式无效: {file_path}")
+                return None
         except json.JSONDecodeError as e:
             logger.error(f"JSON解析失败 {file_path}: {e}")
             return None
@@ -58,29 +169,40 @@ class TestCaseManager:
                 os.makedirs(case_dir, exist_ok=True)
                 return
             
-            # 遍历所有模块目录
-            for module in os.listdir(case_dir):
-                module_path = os.path.join(case_dir, module)
-                if os.path.isdir(module_path):
-                    self.test_cases[module] = []
-                    # 并行加载模块下的所有用例文件
-                    case_files = [
-                        os.path.join(module_path, f)
-                        for f in os.listdir(module_path)
-                        if f.endswith('.json')
-                    ]
-                    
-                    # 使用线程池并行加载
-                    futures = [
-                        self._executor.submit(self._load_single_case, file_path)
-                        for file_path in case_files
-                    ]
+            # 重新加载时清空旧数据，已删除文件的用例不再保留
+            self.test_cases.clear()
+            self._case_files.clear()
+            
+            # 收集所有模块下的用例文件
+            jobs = []
+            with os.scandir(case_dir) as modules:
+                for module_entry in modules:
+                    if not module_entry.is_dir():
+                        continue
+                    self.test_cases[module_entry.name] = {}
+                    with os.scandir(module_entry.path) as entries:
+                        jobs.extend(
+                            (module_entry.name, entry.path)
+                            for entry in entries
+                            if entry.name.endswith('.json')
+                        )
+            
+            # 一次性提交到线程池并行加载；加载以 I/O 为主，线程数适当超过 CPU 核数
+            if jobs:
+                # 按路径排序并按提交顺序收集结果，同名用例固定由文件名（时间戳）最新的一个生效
+                jobs.sort(key=itemgetter(1))
+                max_workers = min(32, (os.cpu_count() or 4) * 2, len(jobs))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    results = executor.map(
+                        self._load_single_case, (file_path for _, file_path in jobs)
+                    )
                     
                     # 收集结果
-                    for future in futures:
-                        test_case = future.result()
-                        if test_case:
-                            self.test_cases[module].append(test_case)
+                    for (module, _), result in zip(jobs, results):
+                        if result:
+                            file_path, test_case = result
+                            self.test_cases[module][test_case['name']] = test_case
+                            self._case_files[(module, test_case['name'])] = file_path
             
             logger.info(f"测试用例加载完成，共加载 {sum(len(cases) for cases in self.test_cases.values())} 个用例")
         
@@ -104,18 +226,20 @@ class TestCaseManager:
                 raise ValueError("必填参数不能为空")
             
             # 检查用例名称是否已存在
-            if self.get_test_case(module, name):
+            if name in self.test_cases.get(module, {}):
                 raise ValueError(f"测试用例已存在: {module}/{name}")
             
             # 准备测试用例数据
+            now = int(time.time())
+            stamp = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now))
             test_case = {
                 'name': name,
                 'description': description,
                 'module': module,
                 'steps': steps,
                 'assertions': assertions,
-                'created_at': time.strftime('%Y-%m-%d %H:%M:%S'),
-                'updated_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'created_at': stamp,
+                'updated_at': stamp,
                 'status': 'active'
             }
             
@@ -124,19 +248,15 @@ class TestCaseManager:
             os.makedirs(save_dir, exist_ok=True)
             
             # 生成文件名并保存
-            filename = f"{int(time.time())}_{name.replace(' ', '_')}.json"
+            filename = f"{now}_{name.replace(' ', '_')}.json"
             file_path = os.path.join(save_dir, filename)
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(test_case, f, ensure_ascii=False, indent=2)
+            with open(file_path, 'wb') as f:
+                f.write(_json_dumps(test_case, self._pretty_json))
             
-            # 更新内存中的用例列表
-            if module not in self.test_cases:
-                self.test_cases[module] = []
-            self.test_cases[module].append(test_case)
-            
-            # 清除缓存
-            self.get_test_case.cache_clear()
+            # 更新内存中的用例索引
+            self.test_cases.setdefault(module, {})[name] = test_case
+            self._case_files[(module, name)] = file_path
             
             logger.info(f"测试用例创建成功: {file_path}")
             return True
@@ -145,7 +265,6 @@ class TestCaseManager:
             logger.error(f"创建测试用例失败: {e}")
             return False
     
-    @lru_cache(maxsize=128)
     def get_test_case(self, module: str, name: str) -> Optional[Dict]:
         """
         获取指定的测试用例
@@ -153,12 +272,7 @@ class TestCaseManager:
         :param name: 用例名称
         :return: 测试用例数据或None
         """
-        try:
-            cases = self.test_cases.get(module, [])
-            return next((case for case in cases if case['name'] == name), None)
-        except Exception as e:
-            logger.error(f"获取测试用例失败: {e}")
-            return None
+        return self.test_cases.get(module, {}).get(name)
     
     def update_test_case(self, module: str, name: str, updates: Dict) -> bool:
         """
@@ -184,29 +298,23 @@ class TestCaseManager:
             test_case['updated_at'] = time.strftime('%Y-%m-%d %H:%M:%S')
             
             # 保存到文件
-            module_dir = os.path.join(self.config['test']['case_dir'], module)
-            for filename in os.listdir(module_dir):
-                if filename.endswith('.json'):
-                    file_path = os.path.join(module_dir, filename)
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        current_case = json.load(f)
-                        if current_case['name'] == name:
-                            with open(file_path, 'w', encoding='utf-8') as f:
-                                json.dump(test_case, f, ensure_ascii=False, indent=2)
-                            
-                            # 更新内存中的用例
-                            for i, case in enumerate(self.test_cases[module]):
-                                if case['name'] == name:
-                                    self.test_cases[module][i] = test_case
-                                    break
-                            
-                            # 清除缓存
-                            self.get_test_case.cache_clear()
-                            
-                            logger.info(f"测试用例已更新: {file_path}")
-                            return True
-            
-            raise FileNotFoundError(f"未找到测试用例文件: {module}/{name}")
+            file_path = self._case_files.get((module, name))
+            if not file_path:
+                raise FileNotFoundError(f"未找到测试用例文件: {module}/{name}")
+            
+            with open(file_path, 'wb') as f:
+                f.write(_json_dumps(test_case, self._pretty_json))
+            
+            # 更新内存中的用例（名称变更时同步索引键）
+            module_cases = self.test_cases[module]
+            if test_case['name'] != name:
+                module_cases.pop(name, None)
+                del self._case_files[(module, name)]
+            module_cases[test_case['name']] = test_case
+            self._case_files[(module, test_case['name'])] = file_path
+            
+            logger.info(f"测试用例已更新: {file_path}")
+            return True
         
         except Exception as e:
             logger.error(f"更新测试用例失败: {e}")
@@ -221,35 +329,25 @@ class TestCaseManager:
         """
         try:
             # 检查用例是否存在
-            if not self.get_test_case(module, name):
+            if name not in self.test_cases.get(module, {}):
                 raise FileNotFoundError(f"未找到测试用例: {module}/{name}")
             
-            module_dir = os.path.join(self.config['test']['case_dir'], module)
-            for filename in os.listdir(module_dir):
-                if filename.endswith('.json'):
-                    file_path = os.path.join(module_dir, filename)
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        test_case = json.load(f)
-                        if test_case['name'] == name:
-                            # 创建备份
-                            backup_dir = os.path.join(self.config['test']['case_dir'], '_deleted')
-                            os.makedirs(backup_dir, exist_ok=True)
-                            backup_path = os.path.join(backup_dir, f"{module}_{filename}")
-                            os.rename(file_path, backup_path)
-                            
-                            # 从内存中移除
-                            self.test_cases[module] = [
-                                case for case in self.test_cases[module]
-                                if case['name'] != name
-                            ]
-                            
-                            # 清除缓存
-                            self.get_test_case.cache_clear()
-                            
-                            logger.info(f"测试用例已删除并备份: {backup_path}")
-                            return True
-            
-            raise FileNotFoundError(f"未找到测试用例文件: {module}/{name}")
+            file_path = self._case_files.get((module, name))
+            if not file_path:
+                raise FileNotFoundError(f"未找到测试用例文件: {module}/{name}")
+            
+            # 创建备份
+            backup_dir = os.path.join(self.config['test']['case_dir'], '_deleted')
+            os.makedirs(backup_dir, exist_ok=True)
+            backup_path = os.path.join(backup_dir, f"{module}_{os.path.basename(file_path)}")
+            os.rename(file_path, backup_path)
+            
+            # 从内存中移除
+            self.test_cases[module].pop(name, None)
+            del self._case_files[(module, name)]
+            
+            logger.info(f"测试用例已删除并备份: {backup_path}")
+            return True
         
         except Exception as e:
             logger.error(f"删除测试用例失败: {e}")
@@ -263,14 +361,15 @@ class TestCaseManager:
         :return: 测试用例列表
         """
         try:
-            cases = self.test_cases.get(module, []) if module else [
-                case for cases in self.test_cases.values() for case in cases
+            cases = list(self.test_cases.get(module, {}).values()) if module else [
+                case for cases in self.test_cases.values() for case in cases.values()
             ]
             
             if status:
                 cases = [case for case in cases if case.get('status') == status]
             
-            return sorted(cases, key=lambda x: x['updated_at'], reverse=True)
+            # updated_at 为 '%Y-%m-%d %H:%M:%S' 格式，可直接按字符串比较
+            return sorted(cases, key=itemgetter('updated_at'), reverse=True)
         
         except Exception as e:
             logger.error(f"获取测试用例列表失败: {e}")
@@ -286,67 +385,35 @@ class TestCaseManager:
             if not self._validate_test_case(test_case):
                 raise ValueError("无效的测试用例格式")
             
-            code_lines = [
-                "import pytest",
-                "from appium import webdriver",
-                "from appium.webdriver.common.appiumby import AppiumBy",
-                "from selenium.webdriver.support.ui import WebDriverWait",
-                "from selenium.webdriver.support import expected_conditions as EC",
-                "from selenium.common.exceptions import TimeoutException",
-                "import time\n",
-                f"def test_{test_case['module']}_{test_case['name'].lower().replace(' ', '_')}(driver):",
-                "    try:",
-                "        wait = WebDriverWait(driver, 10)"
-            ]
+            parts = [_CODE_HEADER_TMPL.format(
+                func_name=f"{test_case['module']}_{test_case['name'].lower().replace(' ', '_')}"
+            )]
             
             # 添加测试步骤
             for i, step in enumerate(test_case['steps'], 1):
                 if step['type'] == 'operation':
                     # 添加操作步骤代码
-                    code_lines.extend([
-                        f"        # 步骤 {i}: {step['description']}",
-                        f"        try:",
-                        f"            {step['code']}",
-                        f"        except TimeoutException:",
-                        f"            logger.error(f'步骤 {i} 超时: {step['description']}')",
-                        f"            return False",
-                        f"        except Exception as e:",
-                        f"            logger.error(f'步骤 {i} 失败: {{e}}')",
-                        f"            return False"
-                    ])
+                    parts.append(_OPERATION_STEP_TMPL.format(
+                        i=i, desc=step['description'], code=step['code']
+                    ))
                 elif step['type'] == 'test_case':
                     # 添加调用其他测试用例的代码
-                    code_lines.extend([
-                        f"        # 步骤 {i}: 执行测试用例 {step['name']}",
-                        f"        if not test_{step['module']}_{step['name'].lower().replace(' ', '_')}(driver):",
-                        f"            logger.error('子用例执行失败: {step['name']}')",
-                        f"            return False"
-                    ])
+                    parts.append(_CASE_STEP_TMPL.format(
+                        i=i,
+                        name=step['name'],
+                        func_name=f"{step['module']}_{step['name'].lower().replace(' ', '_')}"
+                    ))
             
             # 添加断言
-            for i, assertion in enumerate(test_case['assertions'], 1):
-                code_lines.extend([
-                    f"        # 断言 {i}: {assertion['description']}",
-                    f"        try:",
-                    f"            {assertion['code']}",
-                    f"        except AssertionError:",
-                    f"            logger.error(f'断言 {i} 失败: {assertion['description']}')",
-                    f"            return False",
-                    f"        except Exception as e:",
-                    f"            logger.error(f'断言 {i} 执行异常: {{e}}')",
-                    f"            return False"
-                ])
+            parts.extend(
+                _ASSERTION_TMPL.format(i=i, desc=assertion['description'], code=assertion['code'])
+                for i, assertion in enumerate(test_case['assertions'], 1)
+            )
             
             # 添加成功返回
-            code_lines.extend([
-                "        logger.info('测试用例执行成功')",
-                "        return True",
-                "    except Exception as e:",
-                "        logger.error(f'测试执行失败: {e}')",
-                "        return False"
-            ])
-            
-            return '\n'.join(['    ' + line for line in code_lines])
+            parts.append(_CODE_FOOTER)
+            
+            return '\n'.join(parts)
         
         except Exception as e:
             logger.error(f"生成测试代码失败: {e}")
@@ -362,25 +429,38 @@ class TestCaseManager:
             report_dir = self.config['test']['report_dir']
             os.makedirs(report_dir, exist_ok=True)
             
+            # 单次遍历统计结果
+            passed = failed = 0
+            total_duration = 0
+            for r in results:
+                status = r['status']
+                if status == 'passed':
+                    passed += 1
+                elif status == 'failed':
+                    failed += 1
+                total_duration += r['duration']
+            
+            # 报告时间与文件名共用同一个 localtime 结果
+            local_time = time.localtime()
+            
             # 生成报告数据
             report_data = {
-                'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'timestamp': time.strftime('%Y-%m-%d %H:%M:%S', local_time),
                 'total_cases': len(results),
-                'passed_cases': len([r for r in results if r['status'] == 'passed']),
-                'failed_cases': len([r for r in results if r['status'] == 'failed']),
-                'total_duration': sum(r['duration'] for r in results),
+                'passed_cases': passed,
+                'failed_cases': failed,
+                'total_duration': total_duration,
                 'results': results
             }
             
             # 生成报告文件名
             report_file = os.path.join(
                 report_dir,
-                f"report_{time.strftime('%Y%m%d_%H%M%S')}.json"
+                f"report_{time.strftime('%Y%m%d_%H%M%S', local_time)}.json"
             )
             
             # 保存报告
-            with open(report_file, 'w', encoding='utf-8') as f:
-                json.dump(report_data, f, ensure_ascii=False, indent=2)
+            _write_bytes_path(report_file, _json_dumps(report_data, self._pretty_json))
             
             logger.info(f"测试报告已保存: {report_file}")
             
@@ -397,17 +477,20 @@ class TestCaseManager:
         :param keep_count: 保留的报告数量
         """
         try:
-            reports = [
-                os.path.join(report_dir, f)
-                for f in os.listdir(report_dir)
-                if f.startswith('report_') and f.endswith('.json')
-            ]
+            with os.scandir(report_dir) as it:
+                reports = [
+                    (entry.stat().st_mtime, entry.path)
+                    for entry in it
+                    if entry.name.startswith('report_') and entry.name.endswith('.json')
+                ]
             
-            # 按修改时间排序
-            reports.sort(key=lambda x: os.path.getmtime(x), reverse=True)
+            # 只选出需要删除的最旧报告
+            if len(reports) <= keep_count:
+                return
+            victims = heapq.nsmallest(len(reports) - keep_count, reports)
             
             # 删除旧报告
-            for report in reports[keep_count:]:
+            for _, report in victims:
                 try:
                     os.remove(report)
                     logger.debug(f"已删除旧报告: {report}")
@@ -416,9 +499,3 @@ class TestCaseManager:
         
         except Exception as e:
             logger.error(f"清理旧报告失败: {e}")
-    
-    def __del__(self):
-        """
-        清理资源
-        """
-        self._executor.shutdown(wait=True) 
\ No newline at end of file
@@ -1,9 +1,14 @@
-from .platform_tab import PlatformTab
-from .device_tab import DeviceTab
-from .record_tab import RecordTab
-from .assert_tab import AssertTab
-from .testcase_tab import TestCaseTab
-from .report_tab import ReportTab
+import importlib
+
+# 各标签页在首次访问时才导入（PEP 562）
+_LAZY_IMPORTS = {
+    'PlatformTab': '.platform_tab',
+    'DeviceTab': '.device_tab',
+    'RecordTab': '.record_tab',
+    'AssertTab': '.assert_tab',
+    'TestCaseTab': '.testcase_tab',
+    'ReportTab': '.report_tab'
+}
 
 __all__ = [
     'PlatformTab',
@@ -12,4 +17,17 @@ __all__ = [
     'AssertTab',
     'TestCaseTab',
     'ReportTab'
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
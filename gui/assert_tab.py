@@ -1,24 +1,113 @@
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QFrame, QComboBox, QLineEdit,
-    QTextEdit, QMessageBox, QTreeWidget, QTreeWidgetItem,
+    QTextEdit, QMessageBox, QTreeView,
     QDialog, QFormLayout, QRadioButton, QButtonGroup
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import (
+    Qt, Signal, QTimer, QObject, QRunnable, QThreadPool,
+    QAbstractItemModel, QModelIndex
+)
 from loguru import logger
 from core.assertion_manager import AssertionManager
 
+# 元素定位方式
+LOCATOR_TYPES = (
+    "accessibility_id",
+    "id",
+    "xpath",
+    "class_name",
+    "name",
+    "android_uiautomator",
+    "ios_predicate"
+)
+
+# 断言树列标题
+TREE_HEADERS = ("名称", "描述", "类型", "创建时间")
+
+# 按钮样式（按 objectName 区分），对话框和标签页共用
+BUTTON_STYLE = """
+    QPushButton#primaryBtn, QPushButton#dangerBtn, QPushButton#infoBtn {
+        padding: 5px 15px;
+        color: white;
+        border: none;
+        border-radius: 3px;
+    }
+    QPushButton#primaryBtn {
+        background-color: #4CAF50;
+    }
+    QPushButton#primaryBtn:hover {
+        background-color: #45a049;
+    }
+    QPushButton#primaryBtn:disabled {
+        background-color: #cccccc;
+    }
+    QPushButton#dangerBtn {
+        background-color: #f44336;
+    }
+    QPushButton#dangerBtn:hover {
+        background-color: #e53935;
+    }
+    QPushButton#infoBtn {
+        background-color: #2196F3;
+    }
+    QPushButton#infoBtn:hover {
+        background-color: #1976D2;
+    }
+    QPushButton#infoBtn:disabled {
+        background-color: #cccccc;
+    }
+"""
+
+# 断言标签页样式，在标签页上统一设置一次
+ASSERT_TAB_STYLE = BUTTON_STYLE + """
+    QLabel#sectionTitle {
+        font-size: 16px;
+        font-weight: bold;
+        color: #333333;
+        padding: 10px;
+    }
+    QLabel#deviceInfo {
+        padding: 10px;
+        background-color: #f5f5f5;
+        border-radius: 3px;
+    }
+    QLabel#statusLabel {
+        color: #4CAF50;
+    }
+    QTreeView {
+        border: 1px solid #cccccc;
+        border-radius: 3px;
+    }
+    QTreeView::item {
+        padding: 5px;
+    }
+"""
+
 class CreateAssertDialog(QDialog):
     """创建断言对话框"""
+    # 输入校验的防抖间隔（毫秒）
+    VALIDATE_DELAY_MS = 250
+    
     def __init__(self, modules, parent=None):
         super().__init__(parent)
         self.modules = modules
+        
+        # 输入停止一段时间后才校验，避免每次按键都执行
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(self.VALIDATE_DELAY_MS)
+        self._validate_timer.timeout.connect(self._do_validate)
+        
         self.init_ui()
     
     def init_ui(self):
         """初始化UI"""
         self.setWindowTitle("创建断言")
         self.setModal(True)
+        self.setStyleSheet(BUTTON_STYLE)
         
         layout = QFormLayout()
         
@@ -38,15 +127,7 @@ class CreateAssertDialog(QDialog):
         
         # 定位方式
         self.locator_type_combo = QComboBox()
-        self.locator_type_combo.addItems([
-            "accessibility_id",
-            "id",
-            "xpath",
-            "class_name",
-            "name",
-            "android_uiautomator",
-            "ios_predicate"
-        ])
+        self.locator_type_combo.addItems(LOCATOR_TYPES)
         layout.addRow("定位方式:", self.locator_type_combo)
         
         # 定位值
@@ -74,49 +155,69 @@ class CreateAssertDialog(QDialog):
         layout.addRow("期望文本:", self.expected_text_edit)
         
         # 连接信号
-        self.text_radio.toggled.connect(
-            lambda checked: self.expected_text_edit.setEnabled(checked)
-        )
+        self.text_radio.toggled.connect(self.expected_text_edit.setEnabled)
         
         # 按钮布局
         button_layout = QHBoxLayout()
         
         self.cancel_button = QPushButton("取消")
         self.cancel_button.clicked.connect(self.reject)
-        self.cancel_button.setStyleSheet("""
-            QPushButton {
-                padding: 5px 15px;
-                background-color: #f44336;
-                color: white;
-                border: none;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #e53935;
-            }
-        """)
+        self.cancel_button.setObjectName("dangerBtn")
         
         self.save_button = QPushButton("保存")
         self.save_button.clicked.connect(self.accept)
-        self.save_button.setStyleSheet("""
-            QPushButton {
-                padding: 5px 15px;
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
+        self.save_button.setObjectName("primaryBtn")
         
         button_layout.addWidget(self.cancel_button)
         button_layout.addWidget(self.save_button)
         
         layout.addRow("", button_layout)
         
+        # 输入变化时延迟校验
+        self.name_edit.textChanged.connect(self._schedule_validate)
+        self.desc_edit.textChanged.connect(self._schedule_validate)
+        self.locator_value_edit.textChanged.connect(self._schedule_validate)
+        self.expected_text_edit.textChanged.connect(self._schedule_validate)
+        self.text_radio.toggled.connect(self._schedule_validate)
+        
         self.setLayout(layout)
+        self._do_validate()
+    
+    def _schedule_validate(self, *args):
+        """重新开始校验计时"""
+        self._validate_timer.start()
+    
+    def _do_validate(self):
+        """校验必填项，未填写完整时禁用保存按钮"""
+        valid = bool(
+            self.name_edit.text().strip() and
+            self.desc_edit.toPlainText().strip() and
+            self.locator_value_edit.text().strip()
+        )
+        if valid and self.text_radio.isChecked():
+            valid = bool(self.expected_text_edit.text().strip())
+        self.save_button.setEnabled(valid)
+    
+    def reset(self, modules=None):
+        """清空输入，以便复用对话框
+        
+        :param modules: 模块列表，与当前不同时重新填充模块下拉框
+        """
+        if modules is not None and list(modules) != list(self.modules):
+            self.modules = modules
+            self.module_combo.clear()
+            self.module_combo.addItems(self.modules)
+        self.module_combo.setCurrentIndex(0)
+        self.name_edit.clear()
+        self.desc_edit.clear()
+        self.locator_type_combo.setCurrentIndex(0)
+        self.locator_value_edit.clear()
+        self.expected_text_edit.clear()
+        self.exists_radio.setChecked(True)
+        
+        # 清空后立即校验，不等待计时
+        self._validate_timer.stop()
+        self._do_validate()
     
     def get_data(self):
         """获取输入的数据"""
@@ -130,12 +231,244 @@ class CreateAssertDialog(QDialog):
             'expected_text': self.expected_text_edit.text() if self.text_radio.isChecked() else None
         }
 
+class AssertionTreeModel(QAbstractItemModel):
+    """断言树模型（模块 -> 断言），直接持有断言数据，不为每行创建控件
+
+    模块下的断言行在节点首次展开时才通过 fetchMore 提供给视图。
+    """
+    HEADERS = TREE_HEADERS
+    COLUMN_KEYS = ('name', 'description', 'assertion_type', 'created_at')
+    
+    # 顶层（模块）节点的 internalId；断言节点使用所属模块的稳定编号（从1开始），
+    # 这样增删模块时其他模块下已有的索引不会失效
+    _MODULE_ID = 0
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._modules: List[str] = []
+        self._by_module: Dict[str, List[Dict]] = {}
+        self._fetched = set()  # 已向视图提供断言行的模块
+        self._module_ids: Dict[str, int] = {}
+        self._id_modules: Dict[int, str] = {}
+        self._next_module_id = 1
+    
+    def set_assertions(self, by_module: Dict[str, List[Dict]]):
+        """
+        替换全部断言数据
+        :param by_module: 模块名称 -> 断言列表
+        """
+        self.beginResetModel()
+        self._modules = []
+        self._by_module = {}
+        self._fetched = set()
+        self._module_ids = {}
+        self._id_modules = {}
+        for module, items in by_module.items():
+            self._register_module(module)
+            self._by_module[module] = list(items)
+        self.endResetModel()
+    
+    def _register_module(self, module: str):
+        """登记模块并分配稳定编号"""
+        module_id = self._next_module_id
+        self._next_module_id += 1
+        self._modules.append(module)
+        self._module_ids[module] = module_id
+        self._id_modules[module_id] = module
+        self._by_module[module] = []
+    
+    def module_index(self, module: str) -> QModelIndex:
+        """获取模块节点的索引"""
+        if module not in self._module_ids:
+            return QModelIndex()
+        return self.createIndex(self._modules.index(module), 0, self._MODULE_ID)
+    
+    def _assertion_row(self, module: str, name: str) -> int:
+        """查找断言所在行，不存在返回-1"""
+        for row, assertion in enumerate(self._by_module.get(module, ())):
+            if assertion['name'] == name:
+                return row
+        return -1
+    
+    def add_assertion(self, assertion: Dict):
+        """
+        添加单个断言
+        :param assertion: 断言数据（需包含module字段）
+        """
+        module = assertion['module']
+        if module not in self._module_ids:
+            row = len(self._modules)
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._register_module(module)
+            self._by_module[module].append(assertion)
+            self.endInsertRows()
+            return
+        
+        items = self._by_module[module]
+        if module not in self._fetched:
+            # 尚未展开的模块只更新数据，展开时再提供给视图
+            items.append(assertion)
+            return
+        self.beginInsertRows(self.module_index(module), len(items), len(items))
+        items.append(assertion)
+        self.endInsertRows()
+    
+    def remove_assertion(self, module: str, name: str):
+        """
+        移除单个断言，模块为空时一并移除模块节点
+        :param module: 模块名称
+        :param name: 断言名称
+        """
+        row = self._assertion_row(module, name)
+        if row < 0:
+            return
+        
+        items = self._by_module[module]
+        if len(items) == 1:
+            module_row = self._modules.index(module)
+            self.beginRemoveRows(QModelIndex(), module_row, module_row)
+            del self._modules[module_row]
+            del self._by_module[module]
+            del self._id_modules[self._module_ids.pop(module)]
+            self._fetched.discard(module)
+            self.endRemoveRows()
+            return
+        
+        if module not in self._fetched:
+            del items[row]
+            return
+        self.beginRemoveRows(self.module_index(module), row, row)
+        del items[row]
+        self.endRemoveRows()
+    
+    def update_assertion(self, module: str, name: str, assertion: Dict):
+        """
+        更新单个断言，模块变化时移动到新模块下
+        :param module: 原模块名称
+        :param name: 原断言名称
+        :param assertion: 新的断言数据
+        """
+        row = self._assertion_row(module, name)
+        if row < 0 or assertion['module'] != module:
+            self.remove_assertion(module, name)
+            self.add_assertion(assertion)
+            return
+        
+        self._by_module[module][row] = assertion
+        if module in self._fetched:
+            parent = self.module_index(module)
+            self.dataChanged.emit(
+                self.index(row, 0, parent),
+                self.index(row, len(self.COLUMN_KEYS) - 1, parent)
+            )
+    
+    def assertion_key(self, index: QModelIndex) -> Optional[Tuple[str, str]]:
+        """
+        获取断言节点对应的 (模块, 断言名称)
+        :param index: 模型索引
+        :return: (模块, 断言名称)，模块节点或无效索引返回None
+        """
+        if not index.isValid() or index.internalId() == self._MODULE_ID:
+            return None
+        module = self._id_modules[index.internalId()]
+        return module, self._by_module[module][index.row()]['name']
+    
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self._modules)
+        if parent.internalId() == self._MODULE_ID and parent.column() == 0:
+            module = self._modules[parent.row()]
+            return len(self._by_module[module]) if module in self._fetched else 0
+        return 0
+    
+    def hasChildren(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return bool(self._modules)
+        if parent.internalId() == self._MODULE_ID and parent.column() == 0:
+            return bool(self._by_module[self._modules[parent.row()]])
+        return False
+    
+    def canFetchMore(self, parent):
+        if not parent.isValid() or parent.internalId() != self._MODULE_ID:
+            return False
+        module = self._modules[parent.row()]
+        return module not in self._fetched and bool(self._by_module[module])
+    
+    def fetchMore(self, parent):
+        if not self.canFetchMore(parent):
+            return
+        module = self._modules[parent.row()]
+        self.beginInsertRows(parent, 0, len(self._by_module[module]) - 1)
+        self._fetched.add(module)
+        self.endInsertRows()
+    
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+    
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column, self._MODULE_ID)
+        return self.createIndex(row, column, self._module_ids[self._modules[parent.row()]])
+    
+    def parent(self, index=QModelIndex()):
+        if not index.isValid() or index.internalId() == self._MODULE_ID:
+            return QModelIndex()
+        return self.module_index(self._id_modules[index.internalId()])
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if index.internalId() == self._MODULE_ID:
+            return self._modules[index.row()] if index.column() == 0 else None
+        module = self._id_modules[index.internalId()]
+        assertion = self._by_module[module][index.row()]
+        return assertion.get(self.COLUMN_KEYS[index.column()])
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+class _VerifySignals(QObject):
+    """断言验证任务的信号"""
+    finished = Signal(bool, str)  # (是否通过, 信息)
+
+
+class _VerifyTask(QRunnable):
+    """在线程池中验证断言，避免阻塞界面"""
+    def __init__(self, assertion_manager, device, assertion):
+        super().__init__()
+        self.assertion_manager = assertion_manager
+        self.device = device
+        self.assertion = assertion
+        self.signals = _VerifySignals()
+    
+    def run(self):
+        try:
+            passed, message = self.assertion_manager.verify_assertion(
+                self.device,
+                self.assertion
+            )
+        except Exception as e:
+            logger.error(f"验证断言失败: {e}")
+            passed, message = False, str(e)
+        self.signals.finished.emit(passed, message)
+
+
 class AssertTab(QWidget):
+    # 操作结果提示的显示时长（毫秒）
+    STATUS_TIMEOUT_MS = 2000
+    
     def __init__(self, config, parent=None):
         super().__init__(parent)
         self.config = config
         self.assertion_manager = AssertionManager(config)
         self.current_device = None
+        self._modules: List[str] = list(config['test']['modules'])  # 可选模块列表
+        self._create_dialog: Optional[CreateAssertDialog] = None
+        self._verify_task: Optional[_VerifyTask] = None  # 正在执行的验证任务
         self.init_ui()
     
     def init_ui(self):
@@ -143,6 +476,7 @@ class AssertTab(QWidget):
         # 创建主布局
         main_layout = QVBoxLayout()
         main_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
+        self.setStyleSheet(ASSERT_TAB_STYLE)
         
         # 创建断言管理区域
         control_frame = QFrame()
@@ -151,68 +485,40 @@ class AssertTab(QWidget):
         
         # 添加标题
         title_label = QLabel("断言管理")
-        title_label.setStyleSheet("""
-            QLabel {
-                font-size: 16px;
-                font-weight: bold;
-                color: #333333;
-                padding: 10px;
-            }
-        """)
+        title_label.setObjectName("sectionTitle")
         control_layout.addWidget(title_label)
         
         # 创建断言管理按钮
         button_layout = QHBoxLayout()
         
         self.create_button = QPushButton("创建断言")
-        self.create_button.setStyleSheet("""
-            QPushButton {
-                padding: 5px 15px;
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
+        self.create_button.setObjectName("primaryBtn")
         self.create_button.clicked.connect(self.create_assertion)
         
         self.debug_button = QPushButton("调试断言")
         self.debug_button.setEnabled(False)
-        self.debug_button.setStyleSheet("""
-            QPushButton {
-                padding: 5px 15px;
-                background-color: #2196F3;
-                color: white;
-                border: none;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #1976D2;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-            }
-        """)
+        self.debug_button.setObjectName("infoBtn")
         self.debug_button.clicked.connect(self.debug_assertion)
         
         button_layout.addWidget(self.create_button)
         button_layout.addWidget(self.debug_button)
         button_layout.addStretch()
         
+        # 操作结果提示（非模态，定时清除）
+        self._status_label = QLabel("")
+        self._status_label.setObjectName("statusLabel")
+        button_layout.addWidget(self._status_label)
+        
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(self.STATUS_TIMEOUT_MS)
+        self._status_timer.timeout.connect(self._status_label.clear)
+        
         control_layout.addLayout(button_layout)
         
         # 添加设备信息显示
         self.device_info = QLabel("未选择设备")
-        self.device_info.setStyleSheet("""
-            QLabel {
-                padding: 10px;
-                background-color: #f5f5f5;
-                border-radius: 3px;
-            }
-        """)
+        self.device_info.setObjectName("deviceInfo")
         control_layout.addWidget(self.device_info)
         
         control_frame.setLayout(control_layout)
@@ -224,61 +530,26 @@ class AssertTab(QWidget):
         
         # 添加标题
         list_title = QLabel("断言列表")
-        list_title.setStyleSheet("""
-            QLabel {
-                font-size: 16px;
-                font-weight: bold;
-                color: #333333;
-                padding: 10px;
-            }
-        """)
+        list_title.setObjectName("sectionTitle")
         list_layout.addWidget(list_title)
         
         # 创建树形列表
-        self.assertion_tree = QTreeWidget()
-        self.assertion_tree.setHeaderLabels(["名称", "描述", "类型", "创建时间"])
-        self.assertion_tree.setStyleSheet("""
-            QTreeWidget {
-                border: 1px solid #cccccc;
-                border-radius: 3px;
-            }
-            QTreeWidget::item {
-                padding: 5px;
-            }
-        """)
+        self.assertion_model = AssertionTreeModel(self)
+        self.assertion_tree = QTreeView()
+        self.assertion_tree.setModel(self.assertion_model)
+        # 所有行均为单行文本，使用统一行高避免逐行测量
+        self.assertion_tree.setUniformRowHeights(True)
         list_layout.addWidget(self.assertion_tree)
         
         # 创建操作按钮
         operation_button_layout = QHBoxLayout()
         
         self.delete_button = QPushButton("删除")
-        self.delete_button.setStyleSheet("""
-            QPushButton {
-                padding: 5px 15px;
-                background-color: #f44336;
-                color: white;
-                border: none;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #e53935;
-            }
-        """)
+        self.delete_button.setObjectName("dangerBtn")
         self.delete_button.clicked.connect(self.delete_assertion)
         
         self.edit_button = QPushButton("编辑")
-        self.edit_button.setStyleSheet("""
-            QPushButton {
-                padding: 5px 15px;
-                background-color: #2196F3;
-                color: white;
-                border: none;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #1976D2;
-            }
-        """)
+        self.edit_button.setObjectName("infoBtn")
         self.edit_button.clicked.connect(self.edit_assertion)
         
         operation_button_layout.addWidget(self.delete_button)
@@ -309,16 +580,42 @@ class AssertTab(QWidget):
             self.device_info.setText(
                 f"当前设备: {device_info['model']} ({device_info['id']})"
             )
-            self.debug_button.setEnabled(True)
+            # 验证进行中时保持禁用，由完成回调恢复
+            self.debug_button.setEnabled(self._verify_task is None)
         else:
             self.device_info.setText("未选择设备")
             self.debug_button.setEnabled(False)
     
+    def _add_assertion_row(self, module: str, name: str):
+        """将管理器中的单个断言加入树形列表"""
+        assertion = self.assertion_manager.get_assertion(module, name)
+        if not assertion:
+            return
+        self.assertion_model.add_assertion(assertion)
+        self.assertion_tree.expand(self.assertion_model.module_index(module))
+    
+    def _get_dialog(self) -> CreateAssertDialog:
+        """获取断言对话框，首次调用时创建，之后复用并清空输入"""
+        if self._create_dialog is None:
+            self._create_dialog = CreateAssertDialog(self._modules)
+        else:
+            self._create_dialog.reset(self._modules)
+        return self._create_dialog
+    
+    def _show_status(self, text: str):
+        """在状态栏显示操作结果，一段时间后自动清除"""
+        self._status_label.setText(text)
+        self._status_timer.start()
+    
+    def _current_assertion_key(self) -> Optional[Tuple[str, str]]:
+        """获取当前选中断言的 (模块, 断言名称)"""
+        return self.assertion_model.assertion_key(self.assertion_tree.currentIndex())
+    
     def create_assertion(self):
         """创建断言"""
         try:
             # 显示创建对话框
-            dialog = CreateAssertDialog(self.config['test']['modules'])
+            dialog = self._get_dialog()
             if dialog.exec() == QDialog.DialogCode.Accepted:
                 data = dialog.get_data()
                 
@@ -332,9 +629,9 @@ class AssertTab(QWidget):
                     data['assertion_type'],
                     data['expected_text']
                 ):
-                    QMessageBox.information(self, "提示", "断言创建成功")
-                    # 刷新列表
-                    self.load_assertions()
+                    self._show_status("✔ 断言创建成功")
+                    # 只插入新建的断言
+                    self._add_assertion_row(data['module'], data['name'])
                 else:
                     QMessageBox.critical(self, "错误", "创建断言失败")
         
@@ -346,8 +643,8 @@ class AssertTab(QWidget):
         """调试断言"""
         try:
             # 获取选中的断言
-            current_item = self.assertion_tree.currentItem()
-            if not current_item or not current_item.parent():
+            key = self._current_assertion_key()
+            if not key:
                 QMessageBox.warning(self, "警告", "请选择要调试的断言")
                 return
             
@@ -356,70 +653,59 @@ class AssertTab(QWidget):
                 return
             
             # 获取断言数据
-            module = current_item.parent().text(0)
-            assertion_name = current_item.text(0)
-            assertions = self.assertion_manager.get_assertions(module)
-            assertion = next(
-                (a for a in assertions if a['name'] == assertion_name),
-                None
-            )
+            module, assertion_name = key
+            assertion = self.assertion_manager.get_assertion(module, assertion_name)
             
             if not assertion:
                 QMessageBox.warning(self, "警告", "未找到断言数据")
                 return
             
-            # 验证断言
-            passed, message = self.assertion_manager.verify_assertion(
-                self.current_device,
-                assertion
-            )
-            
-            # 显示结果
-            icon = QMessageBox.Icon.Information if passed else QMessageBox.Icon.Warning
-            QMessageBox.information(
-                self,
-                "调试结果",
-                f"断言验证{'通过' if passed else '失败'}: {message}"
-            )
+            # 在线程池中验证断言，完成后显示结果
+            task = _VerifyTask(self.assertion_manager, self.current_device, assertion)
+            task.signals.finished.connect(self._on_verify_finished)
+            self._verify_task = task
+            self.debug_button.setEnabled(False)
+            QThreadPool.globalInstance().start(task)
         
         except Exception as e:
             logger.error(f"调试断言失败: {e}")
             QMessageBox.critical(self, "错误", f"调试断言失败: {str(e)}")
     
+    def _on_verify_finished(self, passed: bool, message: str):
+        """断言验证完成
+        
+        :param passed: 是否通过
+        :param message: 验证信息
+        """
+        self._verify_task = None
+        self.debug_button.setEnabled(self.current_device is not None)
+        QMessageBox.information(
+            self,
+            "调试结果",
+            f"断言验证{'通过' if passed else '失败'}: {message}"
+        )
+    
     def load_assertions(self):
         """加载断言列表"""
         try:
-            self.assertion_tree.clear()
-            
             # 获取所有断言
             assertions = self.assertion_manager.get_assertions()
             
             # 按模块分组
-            modules = {}
+            modules = defaultdict(list)
             for assertion in assertions:
-                module = assertion['module']
-                if module not in modules:
-                    modules[module] = []
-                modules[module].append(assertion)
-            
-            # 添加到树形列表
-            for module, module_assertions in modules.items():
-                # 创建模块节点
-                module_item = QTreeWidgetItem([module])
-                self.assertion_tree.addTopLevelItem(module_item)
-                
-                # 添加断言节点
-                for assertion in module_assertions:
-                    assertion_item = QTreeWidgetItem([
-                        assertion['name'],
-                        assertion['description'],
-                        assertion['assertion_type'],
-                        assertion['created_at']
-                    ])
-                    module_item.addChild(assertion_item)
+                modules[assertion['module']].append(assertion)
             
-            # 展开所有节点
-            self.assertion_tree.expandAll()
+            # 一次性重置模型数据，期间暂停重绘
+            self.assertion_tree.setUpdatesEnabled(False)
+            try:
+                self.assertion_model.set_assertions(modules)
+                # 只展开第一个模块，其他模块保持折叠，展开时再通过 fetchMore 加载断言行
+                first = self.assertion_model.index(0, 0, QModelIndex())
+                if first.isValid():
+                    self.assertion_tree.expand(first)
+            finally:
+                self.assertion_tree.setUpdatesEnabled(True)
         
         except Exception as e:
             logger.error(f"加载断言列表失败: {e}")
@@ -428,14 +714,13 @@ class AssertTab(QWidget):
         """删除断言"""
         try:
             # 获取选中的断言
-            current_item = self.assertion_tree.currentItem()
-            if not current_item or not current_item.parent():
+            key = self._current_assertion_key()
+            if not key:
                 QMessageBox.warning(self, "警告", "请选择要删除的断言")
                 return
             
             # 获取模块和断言名称
-            module = current_item.parent().text(0)
-            assertion_name = current_item.text(0)
+            module, assertion_name = key
             
             # 确认删除
             reply = QMessageBox.question(
@@ -449,9 +734,9 @@ class AssertTab(QWidget):
             if reply == QMessageBox.StandardButton.Yes:
                 # 删除断言
                 if self.assertion_manager.delete_assertion(module, assertion_name):
-                    QMessageBox.information(self, "提示", "断言已删除")
-                    # 刷新列表
-                    self.load_assertions()
+                    self._show_status("✔ 断言已删除")
+                    # 只移除被删除的断言
+                    self.assertion_model.remove_assertion(module, assertion_name)
                 else:
                     QMessageBox.critical(self, "错误", "删除断言失败")
         
@@ -463,26 +748,21 @@ class AssertTab(QWidget):
         """编辑断言"""
         try:
             # 获取选中的断言
-            current_item = self.assertion_tree.currentItem()
-            if not current_item or not current_item.parent():
+            key = self._current_assertion_key()
+            if not key:
                 QMessageBox.warning(self, "警告", "请选择要编辑的断言")
                 return
             
             # 获取断言数据
-            module = current_item.parent().text(0)
-            assertion_name = current_item.text(0)
-            assertions = self.assertion_manager.get_assertions(module)
-            assertion = next(
-                (a for a in assertions if a['name'] == assertion_name),
-                None
-            )
+            module, assertion_name = key
+            assertion = self.assertion_manager.get_assertion(module, assertion_name)
             
             if not assertion:
                 QMessageBox.warning(self, "警告", "未找到断言数据")
                 return
             
             # 显示编辑对话框
-            dialog = CreateAssertDialog(self.config['test']['modules'])
+            dialog = self._get_dialog()
             dialog.module_combo.setCurrentText(module)
             dialog.name_edit.setText(assertion['name'])
             dialog.desc_edit.setText(assertion['description'])
@@ -498,22 +778,14 @@ class AssertTab(QWidget):
             if dialog.exec() == QDialog.DialogCode.Accepted:
                 new_data = dialog.get_data()
                 
-                # 删除原断言
-                self.assertion_manager.delete_assertion(module, assertion_name)
-                
-                # 创建新断言
-                if self.assertion_manager.create_assertion(
-                    new_data['module'],
-                    new_data['name'],
-                    new_data['description'],
-                    new_data['locator_type'],
-                    new_data['locator_value'],
-                    new_data['assertion_type'],
-                    new_data['expected_text']
-                ):
-                    QMessageBox.information(self, "提示", "断言已更新")
-                    # 刷新列表
-                    self.load_assertions()
+                # 一次写入更新断言
+                if self.assertion_manager.update_assertion(module, assertion_name, new_data):
+                    updated = self.assertion_manager.get_assertion(
+                        new_data['module'], new_data['name']
+                    )
+                    self.assertion_model.update_assertion(module, assertion_name, updated)
+                    self.assertion_tree.expand(self.assertion_model.module_index(new_data['module']))
+                    self._show_status("✔ 断言已更新")
                 else:
                     QMessageBox.critical(self, "错误", "更新断言失败")
         
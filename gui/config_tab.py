@@ -1,133 +1,414 @@
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QFrame, QTreeWidget, QTreeWidgetItem,
-    QMessageBox, QLineEdit, QSpinBox, QComboBox,
-    QCheckBox, QFileDialog, QScrollArea, QFormLayout,
-    QTabWidget, QTextEdit
+    QPushButton, QMessageBox, QLineEdit, QSpinBox, QComboBox,
+    QCheckBox, QFileDialog, QFormLayout, QGridLayout, QTabWidget
+)
+from PySide6.QtCore import (
+    Qt, Signal, QObject, QRunnable, QThreadPool, QSignalBlocker,
+    QStringListModel, QTimer
 )
-from PySide6.QtCore import Qt, Signal, QSize
-from PySide6.QtGui import QIcon, QColor
 from loguru import logger
+import copy
+import hashlib
 import json
 import os
+from dataclasses import dataclass
+from functools import partial
+
+try:
+    import orjson
+except ImportError:  # 未安装 orjson 时退回标准库 json
+    orjson = None
+
+# 配置页样式，在 ConfigTab 上统一设置一次，各控件通过类型/objectName/属性匹配
+CONFIG_TAB_STYLE = """
+    QTabWidget::pane {
+        border: 1px solid #dcdcdc;
+        border-radius: 4px;
+        background: white;
+        padding: 10px;
+    }
+    QTabWidget::tab-bar {
+        left: 5px;
+    }
+    QTabBar::tab {
+        background: #f8f9fa;
+        border: 1px solid #dcdcdc;
+        padding: 8px 12px;
+        margin-right: 2px;
+        border-top-left-radius: 4px;
+        border-top-right-radius: 4px;
+    }
+    QTabBar::tab:selected {
+        background: white;
+        border-bottom-color: white;
+    }
+    QTabBar::tab:hover {
+        background: #e9ecef;
+    }
+    QPushButton#saveBtn, QPushButton#resetBtn {
+        padding: 8px 20px;
+        color: white;
+        border: none;
+        border-radius: 3px;
+        font-weight: bold;
+        min-width: 100px;
+    }
+    QPushButton#saveBtn {
+        background-color: #4CAF50;
+    }
+    QPushButton#saveBtn:hover {
+        background-color: #45a049;
+    }
+    QPushButton#saveBtn:pressed {
+        background-color: #3d8b40;
+    }
+    QPushButton#resetBtn {
+        background-color: #f44336;
+    }
+    QPushButton#resetBtn:hover {
+        background-color: #e53935;
+    }
+    QPushButton#resetBtn:pressed {
+        background-color: #d32f2f;
+    }
+    QPushButton#browseBtn {
+        padding: 5px 15px;
+        background-color: #6c757d;
+        color: white;
+        border: none;
+        border-radius: 3px;
+    }
+    QPushButton#browseBtn:hover {
+        background-color: #5a6268;
+    }
+    QLineEdit, QComboBox, QSpinBox {
+        padding: 5px;
+        border: 1px solid #dcdcdc;
+        border-radius: 3px;
+        background: white;
+    }
+    QLineEdit:hover, QComboBox:hover, QSpinBox:hover {
+        border-color: #4CAF50;
+    }
+    QLineEdit[readOnly="true"] {
+        background: #f8f9fa;
+    }
+    QLineEdit[readOnly="true"]:hover {
+        border-color: #dcdcdc;
+    }
+    QSpinBox QLineEdit {
+        padding: 0px;
+        border: none;
+        background: transparent;
+    }
+    QCheckBox::indicator {
+        width: 18px;
+        height: 18px;
+    }
+    QCheckBox::indicator:unchecked {
+        border: 1px solid #dcdcdc;
+        background: white;
+        border-radius: 3px;
+    }
+    QCheckBox::indicator:checked {
+        border: 1px solid #4CAF50;
+        background: #4CAF50;
+        border-radius: 3px;
+    }
+    QLabel#groupTitle {
+        font-weight: bold;
+    }
+"""
+
+
+# 下拉框选项
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR")
+THEMES = ("浅色", "深色", "跟随系统")
+RECORD_MODES = ("完整模式", "简单模式")
+
+
+@dataclass
+class ConfigModel:
+    """配置页管理的配置项（扁平结构），字段默认值即默认配置"""
+    # 基本设置
+    work_dir: str = ''
+    log_level: str = 'INFO'
+    auto_save: bool = False
+    theme: str = '浅色'
+    # 设备设置
+    android_sdk: str = ''
+    ios_cert: str = ''
+    device_timeout: int = 30
+    auto_reconnect: bool = True
+    # 录制设置
+    record_interval: int = 2
+    record_mode: str = '完整模式'
+    save_dir: str = ''
+    record_auto_save: bool = False
+    # 高级设置
+    appium_host: str = '127.0.0.1'
+    appium_port: int = 4723
+    proxy_enabled: bool = False
+    proxy_host: str = '127.0.0.1'
+    proxy_port: int = 8888
+    
+    @classmethod
+    def from_dict(cls, config: dict) -> 'ConfigModel':
+        """
+        从嵌套的配置字典创建，缺失的项使用默认值
+        :param config: 配置字典
+        :return: 配置模型
+        """
+        device = config.get('device', {})
+        record = config.get('record', {})
+        # 只在需要默认路径时获取一次当前目录
+        cwd = os.getcwd() if 'work_dir' not in config or 'save_dir' not in record else None
+        default_save_dir = os.path.join(cwd, 'recordings') if cwd is not None else None
+        advanced = config.get('advanced', {})
+        appium = advanced.get('appium', {})
+        proxy = advanced.get('proxy', {})
+        return cls(
+            work_dir=config['work_dir'] if 'work_dir' in config else cwd,
+            log_level=config.get('log_level', cls.log_level),
+            auto_save=config.get('auto_save', cls.auto_save),
+            theme=config.get('theme', cls.theme),
+            android_sdk=device.get('android_sdk', cls.android_sdk),
+            ios_cert=device.get('ios_cert', cls.ios_cert),
+            device_timeout=device.get('timeout', cls.device_timeout),
+            auto_reconnect=device.get('auto_reconnect', cls.auto_reconnect),
+            record_interval=record.get('interval', cls.record_interval),
+            record_mode=record.get('mode', cls.record_mode),
+            save_dir=record['save_dir'] if 'save_dir' in record else default_save_dir,
+            record_auto_save=record.get('auto_save', cls.record_auto_save),
+            appium_host=appium.get('host', cls.appium_host),
+            appium_port=appium.get('port', cls.appium_port),
+            proxy_enabled=proxy.get('enabled', cls.proxy_enabled),
+            proxy_host=proxy.get('host', cls.proxy_host),
+            proxy_port=proxy.get('port', cls.proxy_port)
+        )
+    
+    def to_dict(self) -> dict:
+        """
+        转换为嵌套的配置字典
+        :return: 配置字典
+        """
+        return {
+            'work_dir': self.work_dir,
+            'log_level': self.log_level,
+            'auto_save': self.auto_save,
+            'theme': self.theme,
+            'device': {
+                'android_sdk': self.android_sdk,
+                'ios_cert': self.ios_cert,
+                'timeout': self.device_timeout,
+                'auto_reconnect': self.auto_reconnect
+            },
+            'record': {
+                'interval': self.record_interval,
+                'mode': self.record_mode,
+                'save_dir': self.save_dir,
+                'auto_save': self.record_auto_save
+            },
+            'advanced': {
+                'appium': {
+                    'host': self.appium_host,
+                    'port': self.appium_port
+                },
+                'proxy': {
+                    'enabled': self.proxy_enabled,
+                    'host': self.proxy_host,
+                    'port': self.proxy_port
+                }
+            }
+        }
+
+
+# 各选项卡的字段表：(模型属性, 控件属性, 控件类型)
+_BASIC_FIELDS = (
+    ('work_dir', 'work_dir_edit', 'line'),
+    ('log_level', 'log_level_combo', 'combo'),
+    ('auto_save', 'auto_save_check', 'check'),
+    ('theme', 'theme_combo', 'combo'),
+)
+_DEVICE_FIELDS = (
+    ('android_sdk', 'android_sdk_edit', 'line'),
+    ('ios_cert', 'ios_cert_edit', 'line'),
+    ('device_timeout', 'device_timeout_spin', 'spin'),
+    ('auto_reconnect', 'auto_reconnect_check', 'check'),
+)
+_RECORD_FIELDS = (
+    ('record_interval', 'record_interval_spin', 'spin'),
+    ('record_mode', 'record_mode_combo', 'combo'),
+    ('save_dir', 'save_dir_edit', 'line'),
+    ('record_auto_save', 'record_auto_save_check', 'check'),
+)
+_ADVANCED_FIELDS = (
+    ('appium_host', 'appium_host_edit', 'line'),
+    ('appium_port', 'appium_port_spin', 'spin'),
+    ('proxy_enabled', 'enable_proxy_check', 'check'),
+    ('proxy_host', 'proxy_host_edit', 'line'),
+    ('proxy_port', 'proxy_port_spin', 'spin'),
+)
+
+# 控件类型 -> (写入方法名, 读取方法名)
+_WIDGET_ACCESSORS = {
+    'line': ('setText', 'text'),
+    'spin': ('setValue', 'value'),
+    'combo': ('setCurrentText', 'currentText'),
+    'check': ('setChecked', 'isChecked'),
+}
+
+
+def _merge_config(target: dict, source: dict):
+    """
+    将 source 递归合并到 target，保留 target 中 source 没有的键
+    :param target: 被更新的配置字典
+    :param source: 新的配置项
+    """
+    for key, value in source.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            _merge_config(target[key], value)
+        else:
+            target[key] = value
+
+
+def _encode_config(config: dict) -> bytes:
+    """将配置序列化为缩进格式的 UTF-8 JSON 字节串"""
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(config, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+class _SaveConfigSignals(QObject):
+    """配置保存任务的信号"""
+    finished = Signal(object, bool)  # (内容摘要, 是否写入了文件)
+    failed = Signal(str)
+
+
+class _SaveConfigTask(QRunnable):
+    """在线程池中写入配置文件，避免阻塞界面"""
+    def __init__(self, config: dict, config_file: str, last_digest: bytes = None):
+        super().__init__()
+        self.config = config
+        self.config_file = config_file
+        self.last_digest = last_digest
+        self.signals = _SaveConfigSignals()
+    
+    def run(self):
+        try:
+            payload = _encode_config(self.config)
+            # 内容与上次保存相同时跳过写入
+            digest = hashlib.blake2b(payload, digest_size=16).digest()
+            if digest == self.last_digest and os.path.exists(self.config_file):
+                self.signals.finished.emit(digest, False)
+                return
+            
+            # 一次写入临时文件并落盘后再替换，避免写入中断导致配置文件损坏
+            tmp_file = self.config_file + '.tmp'
+            with open(tmp_file, 'wb', buffering=0) as f:
+                f.write(payload)
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.config_file)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(digest, True)
+
 
 class ConfigTab(QWidget):
     # 定义信号
     config_changed = Signal(dict)
     
+    # 配置更改信号的合并间隔（毫秒）
+    CONFIG_CHANGED_DELAY_MS = 200
+    
     def __init__(self, config, parent=None):
         super().__init__(parent)
         self.setObjectName("config_tab")
         self.config = config
+        self._save_task = None  # 正在执行的保存任务
+        self._last_saved_digest = None  # 上次保存内容的摘要
+        
+        # 短时间内多次保存/重置只发送一次配置更改信号
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(self.CONFIG_CHANGED_DELAY_MS)
+        self._emit_timer.timeout.connect(self._emit_config_changed)
+        
+        # 下拉框选项模型，同类下拉框共用
+        self._log_level_model = QStringListModel(list(LOG_LEVELS), self)
+        self._theme_model = QStringListModel(list(THEMES), self)
+        self._record_mode_model = QStringListModel(list(RECORD_MODES), self)
         self.init_ui()
     
     def init_ui(self):
         """初始化UI"""
-        main_layout = QVBoxLayout()
-        main_layout.setSpacing(10)
-        
-        # 创建配置选项卡
-        tab_widget = QTabWidget()
-        tab_widget.setStyleSheet("""
-            QTabWidget::pane {
-                border: 1px solid #dcdcdc;
-                border-radius: 4px;
-                background: white;
-                padding: 10px;
-            }
-            QTabWidget::tab-bar {
-                left: 5px;
-            }
-            QTabBar::tab {
-                background: #f8f9fa;
-                border: 1px solid #dcdcdc;
-                padding: 8px 12px;
-                margin-right: 2px;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-            }
-            QTabBar::tab:selected {
-                background: white;
-                border-bottom-color: white;
-            }
-            QTabBar::tab:hover {
-                background: #e9ecef;
-            }
-        """)
-        
-        # 基本设置
-        basic_tab = self._create_basic_tab()
-        tab_widget.addTab(basic_tab, "基本设置")
-        
-        # 设备设置
-        device_tab = self._create_device_tab()
-        tab_widget.addTab(device_tab, "设备设置")
-        
-        # 录制设置
-        record_tab = self._create_record_tab()
-        tab_widget.addTab(record_tab, "录制设置")
-        
-        # 高级设置
-        advanced_tab = self._create_advanced_tab()
-        tab_widget.addTab(advanced_tab, "高级设置")
-        
-        main_layout.addWidget(tab_widget)
-        
-        # 底部按钮
-        button_layout = QHBoxLayout()
-        
-        # 保存按钮
-        save_btn = QPushButton("保存设置")
-        save_btn.setStyleSheet("""
-            QPushButton {
-                padding: 8px 20px;
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                border-radius: 3px;
-                font-weight: bold;
-                min-width: 100px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-        """)
-        save_btn.clicked.connect(self.save_config)
-        
-        # 重置按钮
-        reset_btn = QPushButton("重置设置")
-        reset_btn.setStyleSheet("""
-            QPushButton {
-                padding: 8px 20px;
-                background-color: #f44336;
-                color: white;
-                border: none;
-                border-radius: 3px;
-                font-weight: bold;
-                min-width: 100px;
-            }
-            QPushButton:hover {
-                background-color: #e53935;
-            }
-            QPushButton:pressed {
-                background-color: #d32f2f;
-            }
-        """)
-        reset_btn.clicked.connect(self.reset_config)
-        
-        button_layout.addWidget(save_btn)
-        button_layout.addWidget(reset_btn)
-        button_layout.addStretch()
-        
-        main_layout.addLayout(button_layout)
-        
-        self.setLayout(main_layout)
-        
-        # 加载配置
-        self.load_config()
+        # 构建期间暂停重绘并屏蔽信号，完成后统一刷新一次
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
+        try:
+            main_layout = QVBoxLayout()
+            main_layout.setSpacing(10)
+            self.setStyleSheet(CONFIG_TAB_STYLE)
+            
+            # 创建配置选项卡，选项卡内容在首次显示时才创建
+            self.tab_widget = QTabWidget()
+            self._tab_specs = (
+                ("基本设置", self._create_basic_tab, _BASIC_FIELDS),
+                ("设备设置", self._create_device_tab, _DEVICE_FIELDS),
+                ("录制设置", self._create_record_tab, _RECORD_FIELDS),
+                ("高级设置", self._create_advanced_tab, _ADVANCED_FIELDS),
+            )
+            self._built_tabs = set()
+            for title, _, _ in self._tab_specs:
+                placeholder = QWidget()
+                placeholder_layout = QVBoxLayout(placeholder)
+                placeholder_layout.setContentsMargins(0, 0, 0, 0)
+                self.tab_widget.addTab(placeholder, title)
+            self.tab_widget.currentChanged.connect(self._ensure_tab_built)
+            self._ensure_tab_built(self.tab_widget.currentIndex())
+            
+            main_layout.addWidget(self.tab_widget)
+            
+            # 底部按钮
+            button_layout = QHBoxLayout()
+            
+            # 保存按钮
+            self.save_btn = QPushButton("保存设置")
+            self.save_btn.setObjectName("saveBtn")
+            self.save_btn.clicked.connect(self.save_config)
+            
+            # 重置按钮
+            reset_btn = QPushButton("重置设置")
+            reset_btn.setObjectName("resetBtn")
+            reset_btn.clicked.connect(self.reset_config)
+            
+            button_layout.addWidget(self.save_btn)
+            button_layout.addWidget(reset_btn)
+            button_layout.addStretch()
+            
+            main_layout.addLayout(button_layout)
+            
+            self.setLayout(main_layout)
+        finally:
+            self.blockSignals(False)
+            self.setUpdatesEnabled(True)
+    
+    def _ensure_tab_built(self, index: int):
+        """
+        首次切换到选项卡时创建其内容并加载对应配置
+        :param index: 选项卡索引
+        """
+        if index < 0 or index in self._built_tabs:
+            return
+        self._built_tabs.add(index)
+        _, create, fields = self._tab_specs[index]
+        try:
+            self.tab_widget.widget(index).layout().addWidget(create())
+            self._load_fields(fields, ConfigModel.from_dict(self.config))
+        except Exception as e:
+            logger.error(f"创建配置选项卡失败: {e}")
     
     def _create_basic_tab(self):
         """创建基本设置选项卡"""
@@ -136,88 +417,20 @@ class ConfigTab(QWidget):
         layout.setSpacing(10)
         
         # 工作目录
-        self.work_dir_edit = QLineEdit()
-        self.work_dir_edit.setReadOnly(True)
-        self.work_dir_edit.setStyleSheet("""
-            QLineEdit {
-                padding: 5px;
-                border: 1px solid #dcdcdc;
-                border-radius: 3px;
-                background: #f8f9fa;
-            }
-        """)
-        
-        work_dir_layout = QHBoxLayout()
-        work_dir_layout.addWidget(self.work_dir_edit)
-        
-        browse_btn = QPushButton("浏览")
-        browse_btn.setStyleSheet("""
-            QPushButton {
-                padding: 5px 15px;
-                background-color: #6c757d;
-                color: white;
-                border: none;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #5a6268;
-            }
-        """)
-        browse_btn.clicked.connect(self.browse_work_dir)
-        work_dir_layout.addWidget(browse_btn)
-        
-        layout.addRow("工作目录:", work_dir_layout)
+        layout.addRow("工作目录:", self._make_browse_row('work_dir_edit', True, "选择工作目录"))
         
         # 日志级别
         self.log_level_combo = QComboBox()
-        self.log_level_combo.addItems(["DEBUG", "INFO", "WARNING", "ERROR"])
-        self.log_level_combo.setStyleSheet("""
-            QComboBox {
-                padding: 5px;
-                border: 1px solid #dcdcdc;
-                border-radius: 3px;
-                background: white;
-            }
-            QComboBox:hover {
-                border-color: #4CAF50;
-            }
-        """)
+        self.log_level_combo.setModel(self._log_level_model)
         layout.addRow("日志级别:", self.log_level_combo)
         
         # 自动保存
         self.auto_save_check = QCheckBox()
-        self.auto_save_check.setStyleSheet("""
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-            }
-            QCheckBox::indicator:unchecked {
-                border: 1px solid #dcdcdc;
-                background: white;
-                border-radius: 3px;
-            }
-            QCheckBox::indicator:checked {
-                border: 1px solid #4CAF50;
-                background: #4CAF50;
-                border-radius: 3px;
-            }
-        """)
         layout.addRow("自动保存:", self.auto_save_check)
         
         # 主题选择
         self.theme_combo = QComboBox()
-        self.theme_combo.addItems(["浅色", "深色", "跟随系统"])
-        self.theme_combo.setStyleSheet("""
-            QComboBox {
-                padding: 5px;
-                border: 1px solid #dcdcdc;
-                border-radius: 3px;
-                background: white;
-            }
-            QComboBox:hover {
-                border-color: #4CAF50;
-            }
-        """)
+        self.theme_combo.setModel(self._theme_model)
         layout.addRow("主题:", self.theme_combo)
         
         widget.setLayout(layout)
@@ -230,106 +443,19 @@ class ConfigTab(QWidget):
         layout.setSpacing(10)
         
         # Android SDK路径
-        self.android_sdk_edit = QLineEdit()
-        self.android_sdk_edit.setReadOnly(True)
-        self.android_sdk_edit.setStyleSheet("""
-            QLineEdit {
-                padding: 5px;
-                border: 1px solid #dcdcdc;
-                border-radius: 3px;
-                background: #f8f9fa;
-            }
-        """)
-        
-        android_sdk_layout = QHBoxLayout()
-        android_sdk_layout.addWidget(self.android_sdk_edit)
-        
-        browse_android_btn = QPushButton("浏览")
-        browse_android_btn.setStyleSheet("""
-            QPushButton {
-                padding: 5px 15px;
-                background-color: #6c757d;
-                color: white;
-                border: none;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #5a6268;
-            }
-        """)
-        browse_android_btn.clicked.connect(lambda: self.browse_path(self.android_sdk_edit))
-        android_sdk_layout.addWidget(browse_android_btn)
-        
-        layout.addRow("Android SDK路径:", android_sdk_layout)
+        layout.addRow("Android SDK路径:", self._make_browse_row('android_sdk_edit'))
         
         # iOS开发者证书
-        self.ios_cert_edit = QLineEdit()
-        self.ios_cert_edit.setReadOnly(True)
-        self.ios_cert_edit.setStyleSheet("""
-            QLineEdit {
-                padding: 5px;
-                border: 1px solid #dcdcdc;
-                border-radius: 3px;
-                background: #f8f9fa;
-            }
-        """)
-        
-        ios_cert_layout = QHBoxLayout()
-        ios_cert_layout.addWidget(self.ios_cert_edit)
-        
-        browse_ios_btn = QPushButton("浏览")
-        browse_ios_btn.setStyleSheet("""
-            QPushButton {
-                padding: 5px 15px;
-                background-color: #6c757d;
-                color: white;
-                border: none;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #5a6268;
-            }
-        """)
-        browse_ios_btn.clicked.connect(lambda: self.browse_path(self.ios_cert_edit))
-        ios_cert_layout.addWidget(browse_ios_btn)
-        
-        layout.addRow("iOS开发者证书:", ios_cert_layout)
+        layout.addRow("iOS开发者证书:", self._make_browse_row('ios_cert_edit'))
         
         # 设备超时时间
         self.device_timeout_spin = QSpinBox()
         self.device_timeout_spin.setRange(5, 300)
         self.device_timeout_spin.setSuffix(" 秒")
-        self.device_timeout_spin.setStyleSheet("""
-            QSpinBox {
-                padding: 5px;
-                border: 1px solid #dcdcdc;
-                border-radius: 3px;
-                background: white;
-            }
-            QSpinBox:hover {
-                border-color: #4CAF50;
-            }
-        """)
         layout.addRow("设备超时时间:", self.device_timeout_spin)
         
         # 自动重连
         self.auto_reconnect_check = QCheckBox()
-        self.auto_reconnect_check.setStyleSheet("""
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-            }
-            QCheckBox::indicator:unchecked {
-                border: 1px solid #dcdcdc;
-                background: white;
-                border-radius: 3px;
-            }
-            QCheckBox::indicator:checked {
-                border: 1px solid #4CAF50;
-                background: #4CAF50;
-                border-radius: 3px;
-            }
-        """)
         layout.addRow("自动重连:", self.auto_reconnect_check)
         
         widget.setLayout(layout)
@@ -345,86 +471,18 @@ class ConfigTab(QWidget):
         self.record_interval_spin = QSpinBox()
         self.record_interval_spin.setRange(1, 60)
         self.record_interval_spin.setSuffix(" 秒")
-        self.record_interval_spin.setStyleSheet("""
-            QSpinBox {
-                padding: 5px;
-                border: 1px solid #dcdcdc;
-                border-radius: 3px;
-                background: white;
-            }
-            QSpinBox:hover {
-                border-color: #4CAF50;
-            }
-        """)
         layout.addRow("录制间隔:", self.record_interval_spin)
         
         # 录制模式
         self.record_mode_combo = QComboBox()
-        self.record_mode_combo.addItems(["完整模式", "简单模式"])
-        self.record_mode_combo.setStyleSheet("""
-            QComboBox {
-                padding: 5px;
-                border: 1px solid #dcdcdc;
-                border-radius: 3px;
-                background: white;
-            }
-            QComboBox:hover {
-                border-color: #4CAF50;
-            }
-        """)
+        self.record_mode_combo.setModel(self._record_mode_model)
         layout.addRow("录制模式:", self.record_mode_combo)
         
         # 保存目录
-        self.save_dir_edit = QLineEdit()
-        self.save_dir_edit.setReadOnly(True)
-        self.save_dir_edit.setStyleSheet("""
-            QLineEdit {
-                padding: 5px;
-                border: 1px solid #dcdcdc;
-                border-radius: 3px;
-                background: #f8f9fa;
-            }
-        """)
-        
-        save_dir_layout = QHBoxLayout()
-        save_dir_layout.addWidget(self.save_dir_edit)
-        
-        browse_save_btn = QPushButton("浏览")
-        browse_save_btn.setStyleSheet("""
-            QPushButton {
-                padding: 5px 15px;
-                background-color: #6c757d;
-                color: white;
-                border: none;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #5a6268;
-            }
-        """)
-        browse_save_btn.clicked.connect(lambda: self.browse_path(self.save_dir_edit, True))
-        save_dir_layout.addWidget(browse_save_btn)
-        
-        layout.addRow("保存目录:", save_dir_layout)
+        layout.addRow("保存目录:", self._make_browse_row('save_dir_edit', True))
         
         # 自动保存
         self.record_auto_save_check = QCheckBox()
-        self.record_auto_save_check.setStyleSheet("""
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-            }
-            QCheckBox::indicator:unchecked {
-                border: 1px solid #dcdcdc;
-                background: white;
-                border-radius: 3px;
-            }
-            QCheckBox::indicator:checked {
-                border: 1px solid #4CAF50;
-                background: #4CAF50;
-                border-radius: 3px;
-            }
-        """)
         layout.addRow("自动保存:", self.record_auto_save_check)
         
         widget.setLayout(layout)
@@ -433,190 +491,111 @@ class ConfigTab(QWidget):
     def _create_advanced_tab(self):
         """创建高级设置选项卡"""
         widget = QWidget()
-        layout = QFormLayout()
+        layout = QGridLayout()
         layout.setSpacing(10)
         
         # Appium设置
-        appium_group = QFrame()
-        appium_group.setStyleSheet("""
-            QFrame {
-                border: 1px solid #dcdcdc;
-                border-radius: 4px;
-                padding: 10px;
-                background: white;
-            }
-        """)
-        appium_layout = QFormLayout()
+        appium_title = QLabel("Appium服务器")
+        appium_title.setObjectName("groupTitle")
+        layout.addWidget(appium_title, 0, 0, 1, 2)
         
         # Appium主机
         self.appium_host_edit = QLineEdit()
         self.appium_host_edit.setPlaceholderText("127.0.0.1")
-        self.appium_host_edit.setStyleSheet("""
-            QLineEdit {
-                padding: 5px;
-                border: 1px solid #dcdcdc;
-                border-radius: 3px;
-                background: white;
-            }
-            QLineEdit:hover {
-                border-color: #4CAF50;
-            }
-        """)
-        appium_layout.addRow("主机:", self.appium_host_edit)
+        layout.addWidget(QLabel("主机:"), 1, 0)
+        layout.addWidget(self.appium_host_edit, 1, 1)
         
         # Appium端口
         self.appium_port_spin = QSpinBox()
         self.appium_port_spin.setRange(1024, 65535)
         self.appium_port_spin.setValue(4723)
-        self.appium_port_spin.setStyleSheet("""
-            QSpinBox {
-                padding: 5px;
-                border: 1px solid #dcdcdc;
-                border-radius: 3px;
-                background: white;
-            }
-            QSpinBox:hover {
-                border-color: #4CAF50;
-            }
-        """)
-        appium_layout.addRow("端口:", self.appium_port_spin)
-        
-        appium_group.setLayout(appium_layout)
-        layout.addRow("Appium服务器:", appium_group)
+        layout.addWidget(QLabel("端口:"), 2, 0)
+        layout.addWidget(self.appium_port_spin, 2, 1)
         
         # 代理设置
-        proxy_group = QFrame()
-        proxy_group.setStyleSheet("""
-            QFrame {
-                border: 1px solid #dcdcdc;
-                border-radius: 4px;
-                padding: 10px;
-                background: white;
-            }
-        """)
-        proxy_layout = QFormLayout()
+        proxy_title = QLabel("代理设置")
+        proxy_title.setObjectName("groupTitle")
+        layout.addWidget(proxy_title, 3, 0, 1, 2)
         
         # 启用代理
         self.enable_proxy_check = QCheckBox()
-        self.enable_proxy_check.setStyleSheet("""
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-            }
-            QCheckBox::indicator:unchecked {
-                border: 1px solid #dcdcdc;
-                background: white;
-                border-radius: 3px;
-            }
-            QCheckBox::indicator:checked {
-                border: 1px solid #4CAF50;
-                background: #4CAF50;
-                border-radius: 3px;
-            }
-        """)
-        proxy_layout.addRow("启用代理:", self.enable_proxy_check)
+        layout.addWidget(QLabel("启用代理:"), 4, 0)
+        layout.addWidget(self.enable_proxy_check, 4, 1)
         
         # 代理主机
         self.proxy_host_edit = QLineEdit()
         self.proxy_host_edit.setPlaceholderText("127.0.0.1")
-        self.proxy_host_edit.setStyleSheet("""
-            QLineEdit {
-                padding: 5px;
-                border: 1px solid #dcdcdc;
-                border-radius: 3px;
-                background: white;
-            }
-            QLineEdit:hover {
-                border-color: #4CAF50;
-            }
-        """)
-        proxy_layout.addRow("主机:", self.proxy_host_edit)
+        layout.addWidget(QLabel("主机:"), 5, 0)
+        layout.addWidget(self.proxy_host_edit, 5, 1)
         
         # 代理端口
         self.proxy_port_spin = QSpinBox()
         self.proxy_port_spin.setRange(1024, 65535)
         self.proxy_port_spin.setValue(8888)
-        self.proxy_port_spin.setStyleSheet("""
-            QSpinBox {
-                padding: 5px;
-                border: 1px solid #dcdcdc;
-                border-radius: 3px;
-                background: white;
-            }
-            QSpinBox:hover {
-                border-color: #4CAF50;
-            }
-        """)
-        proxy_layout.addRow("端口:", self.proxy_port_spin)
+        layout.addWidget(QLabel("端口:"), 6, 0)
+        layout.addWidget(self.proxy_port_spin, 6, 1)
         
-        proxy_group.setLayout(proxy_layout)
-        layout.addRow("代理设置:", proxy_group)
+        # 多余的空间留在底部，保持各行顶部对齐
+        layout.setColumnStretch(1, 1)
+        layout.setRowStretch(7, 1)
         
         widget.setLayout(layout)
         return widget
     
+    def _make_browse_row(self, target_attr: str, is_dir: bool = False, caption: str = None) -> QHBoxLayout:
+        """
+        创建只读路径输入框和浏览按钮
+        :param target_attr: 输入框保存到的属性名
+        :param is_dir: 是否选择目录
+        :param caption: 选择对话框标题
+        :return: 包含输入框和按钮的布局
+        """
+        line_edit = QLineEdit()
+        line_edit.setReadOnly(True)
+        setattr(self, target_attr, line_edit)
+        
+        browse_btn = QPushButton("浏览")
+        browse_btn.setObjectName("browseBtn")
+        browse_btn.clicked.connect(partial(self.browse_path, line_edit, is_dir, caption=caption))
+        
+        row_layout = QHBoxLayout()
+        row_layout.addWidget(line_edit)
+        row_layout.addWidget(browse_btn)
+        return row_layout
+    
     def browse_work_dir(self):
         """浏览工作目录"""
-        dir_path = QFileDialog.getExistingDirectory(
+        self.browse_path(self.work_dir_edit, True, caption="选择工作目录")
+    
+    def browse_path(self, line_edit, is_dir=False, *_, caption=None):
+        """
+        浏览文件/目录路径
+        :param line_edit: 显示路径的输入框
+        :param is_dir: 是否选择目录
+        :param caption: 对话框标题，默认按类型显示
+        """
+        # 使用 open() 以窗口模态方式异步显示（平台支持时为系统原生对话框），
+        # 不在 exec() 中阻塞事件循环，选择结果通过 fileSelected 回填
+        dialog = QFileDialog(
             self,
-            "选择工作目录",
-            self.work_dir_edit.text() or os.getcwd()
+            caption or ("选择目录" if is_dir else "选择文件"),
+            line_edit.text() or os.getcwd()
         )
-        if dir_path:
-            self.work_dir_edit.setText(dir_path)
-    
-    def browse_path(self, line_edit, is_dir=False):
-        """浏览文件/目录路径"""
         if is_dir:
-            path = QFileDialog.getExistingDirectory(
-                self,
-                "选择目录",
-                line_edit.text() or os.getcwd()
-            )
+            dialog.setFileMode(QFileDialog.FileMode.Directory)
+            dialog.setOption(QFileDialog.Option.ShowDirsOnly, True)
         else:
-            path, _ = QFileDialog.getOpenFileName(
-                self,
-                "选择文件",
-                line_edit.text() or os.getcwd()
-            )
-        
-        if path:
-            line_edit.setText(path)
+            dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        dialog.fileSelected.connect(line_edit.setText)
+        dialog.open()
     
     def load_config(self):
-        """加载配置"""
+        """加载配置到已创建的选项卡"""
         try:
-            # 基本设置
-            self.work_dir_edit.setText(self.config.get('work_dir', os.getcwd()))
-            self.log_level_combo.setCurrentText(self.config.get('log_level', 'INFO'))
-            self.auto_save_check.setChecked(self.config.get('auto_save', False))
-            self.theme_combo.setCurrentText(self.config.get('theme', '浅色'))
-            
-            # 设备设置
-            device_config = self.config.get('device', {})
-            self.android_sdk_edit.setText(device_config.get('android_sdk', ''))
-            self.ios_cert_edit.setText(device_config.get('ios_cert', ''))
-            self.device_timeout_spin.setValue(device_config.get('timeout', 30))
-            self.auto_reconnect_check.setChecked(device_config.get('auto_reconnect', True))
-            
-            # 录制设置
-            record_config = self.config.get('record', {})
-            self.record_interval_spin.setValue(record_config.get('interval', 2))
-            self.record_mode_combo.setCurrentText(record_config.get('mode', '完整模式'))
-            self.save_dir_edit.setText(record_config.get('save_dir', os.path.join(os.getcwd(), 'recordings')))
-            self.record_auto_save_check.setChecked(record_config.get('auto_save', False))
-            
-            # 高级设置
-            advanced_config = self.config.get('advanced', {})
-            # Appium设置
-            appium_config = advanced_config.get('appium', {})
-            self.appium_host_edit.setText(appium_config.get('host', '127.0.0.1'))
-            self.appium_port_spin.setValue(appium_config.get('port', 4723))
-            # 代理设置
-            proxy_config = advanced_config.get('proxy', {})
-            self.enable_proxy_check.setChecked(proxy_config.get('enabled', False))
-            self.proxy_host_edit.setText(proxy_config.get('host', '127.0.0.1'))
-            self.proxy_port_spin.setValue(proxy_config.get('port', 8888))
+            model = ConfigModel.from_dict(self.config)
+            for index in sorted(self._built_tabs):
+                self._load_fields(self._tab_specs[index][2], model)
             
             logger.info("配置加载成功")
         
@@ -624,59 +603,93 @@ class ConfigTab(QWidget):
             logger.error(f"加载配置失败: {e}")
             QMessageBox.critical(self, "错误", f"加载配置失败: {str(e)}")
     
+    def _load_fields(self, fields, model: ConfigModel):
+        """
+        将配置模型的值写入控件
+        :param fields: 字段表
+        :param model: 配置模型
+        """
+        # 批量写入期间暂停重绘并屏蔽控件信号，结束后统一刷新一次；
+        # 在 init_ui 中调用时重绘已被暂停，结束后保持原状态
+        updates_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            for attr, widget_attr, kind in fields:
+                widget = getattr(self, widget_attr)
+                with QSignalBlocker(widget):
+                    getattr(widget, _WIDGET_ACCESSORS[kind][0])(getattr(model, attr))
+        finally:
+            self.setUpdatesEnabled(updates_enabled)
+    
     def save_config(self):
         """保存配置"""
         try:
-            # 基本设置
-            self.config['work_dir'] = self.work_dir_edit.text()
-            self.config['log_level'] = self.log_level_combo.currentText()
-            self.config['auto_save'] = self.auto_save_check.isChecked()
-            self.config['theme'] = self.theme_combo.currentText()
+            # 只收集已创建选项卡的设置，未打开的选项卡保持原配置
+            model = ConfigModel.from_dict(self.config)
+            for index in sorted(self._built_tabs):
+                self._save_fields(self._tab_specs[index][2], model)
+            _merge_config(self.config, model.to_dict())
             
-            # 设备设置
-            self.config['device'] = {
-                'android_sdk': self.android_sdk_edit.text(),
-                'ios_cert': self.ios_cert_edit.text(),
-                'timeout': self.device_timeout_spin.value(),
-                'auto_reconnect': self.auto_reconnect_check.isChecked()
-            }
-            
-            # 录制设置
-            self.config['record'] = {
-                'interval': self.record_interval_spin.value(),
-                'mode': self.record_mode_combo.currentText(),
-                'save_dir': self.save_dir_edit.text(),
-                'auto_save': self.record_auto_save_check.isChecked()
-            }
-            
-            # 高级设置
-            self.config['advanced'] = {
-                'appium': {
-                    'host': self.appium_host_edit.text(),
-                    'port': self.appium_port_spin.value()
-                },
-                'proxy': {
-                    'enabled': self.enable_proxy_check.isChecked(),
-                    'host': self.proxy_host_edit.text(),
-                    'port': self.proxy_port_spin.value()
-                }
-            }
-            
-            # 保存到文件
+            # 在线程池中保存到文件，写入期间禁用保存按钮
             config_file = os.path.join(os.getcwd(), 'config.json')
-            with open(config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, ensure_ascii=False, indent=2)
-            
-            logger.info("配置保存成功")
-            QMessageBox.information(self, "成功", "配置已保存")
-            
-            # 发送配置更改信号
-            self.config_changed.emit(self.config)
+            task = _SaveConfigTask(
+                copy.deepcopy(self.config), config_file, self._last_saved_digest
+            )
+            task.signals.finished.connect(self._on_save_finished)
+            task.signals.failed.connect(self._on_save_failed)
+            self._save_task = task
+            self.save_btn.setEnabled(False)
+            QThreadPool.globalInstance().start(task)
         
         except Exception as e:
             logger.error(f"保存配置失败: {e}")
             QMessageBox.critical(self, "错误", f"保存配置失败: {str(e)}")
     
+    def _on_save_finished(self, digest: bytes, written: bool):
+        """
+        配置文件写入完成
+        :param digest: 保存内容的摘要
+        :param written: 是否写入了文件，内容未变化时为False
+        """
+        self._save_task = None
+        self._last_saved_digest = digest
+        self.save_btn.setEnabled(True)
+        
+        if written:
+            logger.info("配置保存成功")
+        else:
+            logger.info("配置未变化，跳过保存")
+        QMessageBox.information(self, "成功", "配置已保存")
+        
+        # 配置有变化时才发送配置更改信号
+        if written:
+            self._emit_timer.start()
+    
+    def _emit_config_changed(self):
+        """发送配置更改信号"""
+        self.config_changed.emit(self.config)
+    
+    def _on_save_failed(self, error: str):
+        """
+        配置文件写入失败
+        :param error: 错误信息
+        """
+        self._save_task = None
+        self.save_btn.setEnabled(True)
+        
+        logger.error(f"保存配置失败: {error}")
+        QMessageBox.critical(self, "错误", f"保存配置失败: {error}")
+    
+    def _save_fields(self, fields, model: ConfigModel):
+        """
+        从控件收集值写入配置模型
+        :param fields: 字段表
+        :param model: 配置模型
+        """
+        for attr, widget_attr, kind in fields:
+            getter = _WIDGET_ACCESSORS[kind][1]
+            setattr(model, attr, getattr(getattr(self, widget_attr), getter)())
+    
     def reset_config(self):
         """重置配置"""
         try:
@@ -690,35 +703,11 @@ class ConfigTab(QWidget):
             
             if reply == QMessageBox.StandardButton.Yes:
                 # 恢复默认配置
-                self.config = {
-                    'work_dir': os.getcwd(),
-                    'log_level': 'INFO',
-                    'auto_save': False,
-                    'theme': '浅色',
-                    'device': {
-                        'android_sdk': '',
-                        'ios_cert': '',
-                        'timeout': 30,
-                        'auto_reconnect': True
-                    },
-                    'record': {
-                        'interval': 2,
-                        'mode': '完整模式',
-                        'save_dir': os.path.join(os.getcwd(), 'recordings'),
-                        'auto_save': False
-                    },
-                    'advanced': {
-                        'appium': {
-                            'host': '127.0.0.1',
-                            'port': 4723
-                        },
-                        'proxy': {
-                            'enabled': False,
-                            'host': '127.0.0.1',
-                            'port': 8888
-                        }
-                    }
-                }
+                cwd = os.getcwd()
+                self.config = ConfigModel(
+                    work_dir=cwd,
+                    save_dir=os.path.join(cwd, 'recordings')
+                ).to_dict()
                 
                 # 重新加载配置
                 self.load_config()
@@ -727,7 +716,7 @@ class ConfigTab(QWidget):
                 QMessageBox.information(self, "成功", "设置已重置为默认值")
                 
                 # 发送配置更改信号
-                self.config_changed.emit(self.config)
+                self._emit_timer.start()
         
         except Exception as e:
             logger.error(f"重置配置失败: {e}")
@@ -3,19 +3,84 @@ from PySide6.QtWidgets import (
     QPushButton, QFrame, QTreeWidget, QTreeWidgetItem,
     QMessageBox, QProgressBar, QHeaderView, QTableWidget,
     QTableWidgetItem, QSplitter, QStyle, QMenu, QComboBox,
-    QSpacerItem, QSizePolicy
+    QSpacerItem, QSizePolicy, QApplication
 )
-from PySide6.QtCore import Qt, Signal, QTimer, QSize
+from PySide6.QtCore import Qt, Signal, QTimer, QSize, QObject, QRunnable, QThreadPool
 from PySide6.QtGui import QIcon, QColor, QPalette, QAction
 from loguru import logger
 from core.device_manager import DeviceManager
-from utils.helpers import get_free_port, format_size, format_time
+from utils.helpers import get_free_port, get_free_ports, format_size, format_time
 import time
 import threading
 import asyncio
 import os
+from functools import partial
+
+# 设备列表第1~5列对应的设备信息字段，第6列为格式化后的存储信息
+DEVICE_FIELDS = ('model', 'platform_version', 'status', 'battery', 'memory')
+
+# 设备状态对应的文字颜色和图标，未列出的状态使用 NO_STATUS_STYLE 清除样式
+NO_STATUS_STYLE = (None, None)
+STATUS_STYLES = {
+    'connected': (QColor('#4CAF50'), QStyle.StandardPixmap.SP_ComputerIcon),  # 绿色
+    'disconnected': (QColor('#F44336'), QStyle.StandardPixmap.SP_MessageBoxCritical),  # 红色
+    'error': (QColor('#FF9800'), QStyle.StandardPixmap.SP_MessageBoxWarning),  # 橙色
+}
+# Appium服务运行中的文字颜色
+RUNNING_COLOR = QColor('#4CAF50')
+
+# 同时启动/停止的Appium服务数量上限，每个服务都是一个独立的Node进程
+APPIUM_CONCURRENCY = min(8, (os.cpu_count() or 1) * 2)
+
+
+async def _gather_limited(coros, limit: int = APPIUM_CONCURRENCY) -> list:
+    """并发执行协程，同时运行的数量不超过 limit
+    
+    :param coros: 协程列表
+    :param limit: 并发上限
+    :return: 与 coros 顺序一致的结果列表，异常作为结果返回
+    """
+    semaphore = asyncio.Semaphore(limit)
+    
+    async def guarded(coro):
+        async with semaphore:
+            return await coro
+    
+    return await asyncio.gather(*(guarded(coro) for coro in coros), return_exceptions=True)
+
+class _DevicePollSignals(QObject):
+    """设备轮询任务的信号"""
+    finished = Signal(object, object)  # (设备列表, Appium服务列表)
+    failed = Signal(str)  # 错误信息
+
+
+class _DevicePollTask(QRunnable):
+    """在线程池中获取设备和Appium服务状态，避免adb调用阻塞界面"""
+    def __init__(self, device_manager):
+        super().__init__()
+        self.device_manager = device_manager
+        self.signals = _DevicePollSignals()
+    
+    def run(self):
+        try:
+            devices = self.device_manager.get_devices()
+            servers = self.device_manager.get_appium_servers()
+        except Exception as e:
+            logger.error(f"轮询设备状态失败: {e}")
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(devices, servers)
+
+
+class _AsyncSignals(QObject):
+    """后台事件循环中协程完成的信号，用于回到界面线程处理结果"""
+    done = Signal(object, object)  # (回调, concurrent.futures.Future)
+
 
 class DeviceTab(QWidget):
+    # 标准图标缓存，所有实例共享
+    _icon_cache = {}
+    
     # 定义信号
     device_selected = Signal(dict)  # 设备选择信号
     device_disconnected = Signal(str)  # 设备断开信号
@@ -41,6 +106,51 @@ class DeviceTab(QWidget):
         self.refresh_interval = 5000  # 刷新间隔（毫秒）
         self._selected_device = None
         
+        # 设备行缓存：设备ID -> 列表项 / 上次写入的行内容
+        self._device_items = {}
+        self._device_row_state = {}
+        self._last_devices_hash = None
+        
+        # Appium服务行缓存：(主机, 端口) -> 行内各列表项 / 上次写入的运行时间
+        self._appium_row_items = {}
+        self._appium_row_state = {}
+        
+        # 合并刷新标记
+        self._devices_dirty = False
+        self._appium_dirty = False
+        
+        # 后台轮询任务，为None表示当前没有正在执行的轮询
+        self.pool = QThreadPool.globalInstance()
+        self._poll_task = None
+        self._repoll_pending = False  # 轮询进行中收到刷新请求，完成后需要再轮询一次
+        self._manual_refresh = False  # 是否有点击刷新按钮触发的刷新等待结果
+        
+        # 批量操作进行中时暂停列表刷新，完成后统一刷新一次
+        self._bulk_op = False
+        self._stop_future = None
+        
+        # 常驻的后台事件循环，设备和Appium服务的异步操作都提交到这里执行
+        self._aio_loop = asyncio.new_event_loop()
+        self._aio_thread = threading.Thread(
+            target=self._run_aio_loop, name="DeviceTabLoop", daemon=True
+        )
+        self._aio_thread.start()
+        self._async_signals = _AsyncSignals()
+        self._async_signals.done.connect(self._on_async_done)
+        
+        # 应用退出时置位，之后不再刷新
+        self._shutting_down = False
+        
+        # 最近一次刷新得到的已连接设备ID和运行中的服务数，
+        # 已连接设备ID为不可变集合，每次刷新整体替换，读取时无需加锁
+        self._connected_ids = frozenset()
+        self._server_count = 0
+        
+        # 右键菜单及当前指向的设备ID / Appium服务的(主机, 端口)
+        self.context_menu = None
+        self._ctx_device_id = None
+        self._ctx_appium_key = None
+        
         # 初始化按钮引用
         self.refresh_btn = None
         self.start_btn = None
@@ -49,8 +159,26 @@ class DeviceTab(QWidget):
         # 初始化UI
         self.init_ui()
         
+        # 应用退出前显式清理，不依赖 __del__ 的调用时机
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
+        
         logger.info("设备标签页初始化完成")
     
+    @classmethod
+    def _standard_icon(cls, pixmap) -> QIcon:
+        """获取缓存的标准图标
+        
+        :param pixmap: QStyle.StandardPixmap
+        :return: 图标
+        """
+        icon = cls._icon_cache.get(pixmap)
+        if icon is None:
+            icon = QApplication.style().standardIcon(pixmap)
+            cls._icon_cache[pixmap] = icon
+        return icon
+    
     def init_ui(self):
         """初始化UI"""
         main_layout = QVBoxLayout()
@@ -62,19 +190,19 @@ class DeviceTab(QWidget):
         
         # 刷新按钮
         self.refresh_btn = QPushButton("刷新")
-        self.refresh_btn.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_BrowserReload))
+        self.refresh_btn.setIcon(self._standard_icon(QStyle.StandardPixmap.SP_BrowserReload))
         self.refresh_btn.clicked.connect(self.refresh_devices)
         toolbar_layout.addWidget(self.refresh_btn)
         
         # 启动服务按钮
         self.start_btn = QPushButton("启动服务")
-        self.start_btn.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_MediaPlay))
+        self.start_btn.setIcon(self._standard_icon(QStyle.StandardPixmap.SP_MediaPlay))
         self.start_btn.clicked.connect(self.start_all_appium_servers)
         toolbar_layout.addWidget(self.start_btn)
         
         # 停止服务按钮
         self.stop_btn = QPushButton("停止服务")
-        self.stop_btn.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_MediaStop))
+        self.stop_btn.setIcon(self._standard_icon(QStyle.StandardPixmap.SP_MediaStop))
         self.stop_btn.clicked.connect(self.stop_all_appium_servers)
         toolbar_layout.addWidget(self.stop_btn)
         
@@ -91,10 +219,13 @@ class DeviceTab(QWidget):
         appium_frame = self._create_appium_frame()
         main_layout.addWidget(appium_frame)
         
+        # 创建右键菜单
+        self._create_context_menus()
+        
         self.setLayout(main_layout)
         
-        # 启动刷新定时器
-        self._start_refresh_timer()
+        # 创建刷新定时器，标签页显示时才开始轮询
+        self._create_refresh_timer()
     
     def _create_device_frame(self):
         """创建设备列表区域"""
@@ -170,49 +301,70 @@ class DeviceTab(QWidget):
         frame.setLayout(layout)
         return frame
     
+    def _create_context_menus(self):
+        """创建右键菜单，菜单只创建一次，显示时更新当前操作对象"""
+        # 设备右键菜单
+        self.context_menu = QMenu(self)
+        
+        def add_device_action(text, pixmap, handler):
+            action = QAction(text, self)
+            action.setIcon(self._standard_icon(pixmap))
+            action.triggered.connect(partial(self._run_device_action, handler))
+            self.context_menu.addAction(action)
+            return action
+        
+        self._act_connect = add_device_action(
+            "连接设备", QStyle.StandardPixmap.SP_DialogApplyButton, self._connect_device)
+        self._act_disconnect = add_device_action(
+            "断开设备", QStyle.StandardPixmap.SP_DialogCancelButton, self._disconnect_device)
+        self.context_menu.addSeparator()
+        self._act_start_appium = add_device_action(
+            "启动Appium服务", QStyle.StandardPixmap.SP_MediaPlay, self._start_appium_for_device)
+        self._act_stop_appium = add_device_action(
+            "停止Appium服务", QStyle.StandardPixmap.SP_MediaStop, self._stop_appium_for_device)
+        self.context_menu.addSeparator()
+        self._act_refresh_device = add_device_action(
+            "刷新设备信息", QStyle.StandardPixmap.SP_BrowserReload, self._refresh_device)
+        
+        # Appium服务右键菜单
+        self.appium_menu = QMenu(self)
+        appium_actions = (
+            ("停止服务", self._stop_appium_server),
+            ("重启服务", self._restart_appium_server),
+            None,
+            ("查看日志", self._view_appium_log),
+        )
+        for spec in appium_actions:
+            if spec is None:
+                self.appium_menu.addSeparator()
+                continue
+            text, handler = spec
+            action = QAction(text, self)
+            action.triggered.connect(partial(self._run_appium_action, handler))
+            self.appium_menu.addAction(action)
+    
+    def _run_device_action(self, handler):
+        """对右键菜单当前指向的设备执行操作"""
+        if self._ctx_device_id is not None:
+            handler(self._ctx_device_id)
+    
+    def _run_appium_action(self, handler):
+        """对右键菜单当前指向的Appium服务执行操作
+        
+        菜单显示期间列表可能被刷新，执行时再按(主机, 端口)查找所在行
+        """
+        items = self._appium_row_items.get(self._ctx_appium_key)
+        if items is None:
+            return
+        handler(self.appium_table.row(items[0]))
+    
     def _show_device_context_menu(self, pos):
         """显示设备右键菜单"""
         try:
             item = self.devices_tree.itemAt(pos)
             if not item:
                 return
-            
-            # 创建右键菜单
-            self.context_menu = QMenu(self)
-            
-            # 连接设备
-            connect_action = QAction("连接设备", self)
-            connect_action.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogApplyButton))
-            connect_action.triggered.connect(lambda: self._connect_device(item))
-            self.context_menu.addAction(connect_action)
-            
-            # 断开设备
-            disconnect_action = QAction("断开设备", self)
-            disconnect_action.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogCancelButton))
-            disconnect_action.triggered.connect(lambda: self._disconnect_device(item))
-            self.context_menu.addAction(disconnect_action)
-            
-            self.context_menu.addSeparator()
-            
-            # 启动Appium服务
-            start_appium_action = QAction("启动Appium服务", self)
-            start_appium_action.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_MediaPlay))
-            start_appium_action.triggered.connect(lambda: self._start_appium_for_device(item))
-            self.context_menu.addAction(start_appium_action)
-            
-            # 停止Appium服务
-            stop_appium_action = QAction("停止Appium服务", self)
-            stop_appium_action.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_MediaStop))
-            stop_appium_action.triggered.connect(lambda: self._stop_appium_for_device(item))
-            self.context_menu.addAction(stop_appium_action)
-            
-            self.context_menu.addSeparator()
-            
-            # 刷新设备信息
-            refresh_action = QAction("刷新设备信息", self)
-            refresh_action.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_BrowserReload))
-            refresh_action.triggered.connect(lambda: self._refresh_device(item))
-            self.context_menu.addAction(refresh_action)
+            self._ctx_device_id = item.text(0)
             
             # 更新菜单项状态
             self._update_button_states()
@@ -230,26 +382,12 @@ class DeviceTab(QWidget):
         if not item:
             return
         
-        menu = QMenu(self)
-        
-        # 停止服务
-        stop_action = QAction("停止服务", self)
-        stop_action.triggered.connect(lambda: self._stop_appium_server(item.row()))
-        menu.addAction(stop_action)
-        
-        # 重启服务
-        restart_action = QAction("重启服务", self)
-        restart_action.triggered.connect(lambda: self._restart_appium_server(item.row()))
-        menu.addAction(restart_action)
-        
-        menu.addSeparator()
-        
-        # 查看日志
-        view_log_action = QAction("查看日志", self)
-        view_log_action.triggered.connect(lambda: self._view_appium_log(item.row()))
-        menu.addAction(view_log_action)
-        
-        menu.exec_(self.appium_table.viewport().mapToGlobal(pos))
+        row = item.row()
+        self._ctx_appium_key = (
+            self.appium_table.item(row, 0).text(),
+            self.appium_table.item(row, 1).text(),
+        )
+        self.appium_menu.exec_(self.appium_table.viewport().mapToGlobal(pos))
     
     def _on_device_selected(self):
         """设备选择处理"""
@@ -271,83 +409,201 @@ class DeviceTab(QWidget):
             logger.error(f"设备选择处理失败: {e}")
     
     def refresh_devices(self):
-        """刷新设备列表"""
+        """刷新设备列表
+        
+        在线程池中获取设备，完成后按设备ID做差异更新，
+        已存在且内容未变的行不做任何操作
+        """
+        if self._refresh_paused():
+            return
         try:
-            # 显示加载状态
+            # 显示加载状态，轮询完成后恢复
+            self._manual_refresh = True
             self.refresh_btn.setEnabled(False)
             self.refresh_btn.setText("正在刷新...")
             
-            # 清空设备列表
-            self.devices_tree.clear()
-                
-            # 获取设备列表
-            devices = self.device_manager.get_devices()
+            # 已有轮询在进行时其结果可能早于本次请求，完成后再轮询一次
+            if self._poll_task is not None:
+                self._repoll_pending = True
+                return
+            self._kick_poll()
+        
+        except Exception as e:
+            self._finish_manual_refresh(f"刷新设备列表失败: {e}")
+    
+    def _finish_manual_refresh(self, error: str = None, count: int = 0):
+        """手动刷新结束，恢复刷新按钮
+        
+        :param error: 错误信息，为None表示刷新成功
+        :param count: 设备数量
+        """
+        if not self._manual_refresh:
+            return
+        self._manual_refresh = False
+        
+        # 恢复按钮状态
+        self.refresh_btn.setEnabled(True)
+        self.refresh_btn.setText("刷新")
+        
+        if error:
+            logger.error(error)
+            self._show_error("错误", error)
+        else:
+            logger.info(f"设备列表刷新完成，共 {count} 个设备")
+    
+    def _apply_devices(self, rows: tuple, rows_hash: int):
+        """将设备列表差异更新到树形列表
+        
+        :param rows: _device_rows 返回的 (设备ID, 文本元组) 序列
+        :param rows_hash: rows 的摘要，用于下次轮询判断内容是否变化
+        """
+        new_ids = {device_id for device_id, _ in rows}
+        
+        # 批量修改期间暂停重绘，结束后只重绘一次
+        updates_enabled = self.devices_tree.updatesEnabled()
+        self.devices_tree.setUpdatesEnabled(False)
+        try:
+            # 移除已消失的设备
+            for device_id in self._device_items.keys() - new_ids:
+                self._remove_device_item(device_id)
             
-            # 添加设备到树形列表
-            for device in devices:
-                item = QTreeWidgetItem(self.devices_tree)
-                item.setText(0, device['id'])
-                item.setText(1, device.get('model', 'unknown'))
-                item.setText(2, device.get('platform_version', 'unknown'))
-                item.setText(3, device.get('status', 'unknown'))
-                item.setText(4, device.get('battery', 'unknown'))
-                item.setText(5, device.get('memory', 'unknown'))
-                
-                # 格式化存储信息显示
-                storage = device.get('storage', {})
-                if isinstance(storage, dict):
-                    storage_text = (
-                        f"总共: {storage.get('total', 'unknown')} | "
-                        f"已用: {storage.get('used', 'unknown')} | "
-                        f"可用: {storage.get('free', 'unknown')}"
-                    )
-                else:
-                    storage_text = str(storage)
-                item.setText(6, storage_text)
+            # 新增或更新设备
+            for device_id, state in rows:
+                item = self._device_items.get(device_id)
+                if item is None:
+                    item = QTreeWidgetItem(self.devices_tree)
+                    item.setText(0, device_id)
+                    self._device_items[device_id] = item
+                    # 如果是当前选中的设备，保持选中状态
+                    if (self._selected_device and
+                            self._selected_device.get('id') == device_id):
+                        item.setSelected(True)
+                elif self._device_row_state.get(device_id) == state:
+                    continue
                 
-                # 设置状态颜色和图标
-                status = device.get('status', '').lower()
-                if status == 'connected':
-                    item.setForeground(3, QColor('#4CAF50'))  # 绿色
-                    item.setIcon(0, self.style().standardIcon(QStyle.StandardPixmap.SP_ComputerIcon))
-                elif status == 'disconnected':
-                    item.setForeground(3, QColor('#F44336'))  # 红色
-                    item.setIcon(0, self.style().standardIcon(QStyle.StandardPixmap.SP_MessageBoxCritical))
-                elif status == 'error':
-                    item.setForeground(3, QColor('#FF9800'))  # 橙色
-                    item.setIcon(0, self.style().standardIcon(QStyle.StandardPixmap.SP_MessageBoxWarning))
-                
-                # 设置提示信息
-                tooltip = (
-                    f"设备ID: {device['id']}\n"
-                    f"型号: {device.get('model', 'unknown')}\n"
-                    f"系统版本: {device.get('platform_version', 'unknown')}\n"
-                    f"状态: {device.get('status', 'unknown')}"
+                self._apply_device_row(
+                    item, device_id, state, self._device_row_state.get(device_id)
                 )
-                for i in range(self.devices_tree.columnCount()):
-                    item.setToolTip(i, tooltip)
-                
-                # 如果是当前选中的设备，保持选中状态
-                if (self._selected_device and 
-                    self._selected_device.get('id') == device['id']):
-                    item.setSelected(True)
-            
-            # 恢复按钮状态
-            self.refresh_btn.setEnabled(True)
-            self.refresh_btn.setText("刷新")
-            
-            # 更新按钮状态
-            self._update_button_states()
-            
-            logger.info(f"设备列表刷新完成，共 {len(devices)} 个设备")
+                self._device_row_state[device_id] = state
+        finally:
+            self.devices_tree.setUpdatesEnabled(updates_enabled)
         
-        except Exception as e:
-            logger.error(f"刷新设备列表失败: {e}")
-            self._show_error("错误", f"刷新设备列表失败: {e}")
-            
-            # 恢复按钮状态
-            self.refresh_btn.setEnabled(True)
-            self.refresh_btn.setText("刷新")
+        self._last_devices_hash = rows_hash
+        self._connected_ids = frozenset(
+            device_id for device_id, state in rows
+            if (state[2] or '').lower() == 'connected'
+        )
+        
+        # 更新按钮状态
+        self._update_button_states()
+    
+    def _device_rows(self, devices: list) -> tuple:
+        """生成设备列表各行的 (设备ID, 文本元组)，其摘要用于定时刷新时判断内容是否变化"""
+        return tuple(
+            (device['id'], self._device_row_state_of(device)) for device in devices
+        )
+    
+    def _schedule_refresh_devices(self):
+        """在下一次事件循环中刷新设备列表，同一轮内的多次请求只刷新一次"""
+        if self._devices_dirty:
+            return
+        self._devices_dirty = True
+        QTimer.singleShot(0, self._flush_device_refresh)
+    
+    def _flush_device_refresh(self):
+        """执行合并后的设备列表刷新"""
+        if not self._devices_dirty:
+            return
+        self._devices_dirty = False
+        self.refresh_devices()
+    
+    def _schedule_refresh_appium(self):
+        """在下一次事件循环中刷新Appium服务状态，同一轮内的多次请求只刷新一次"""
+        if self._appium_dirty:
+            return
+        self._appium_dirty = True
+        QTimer.singleShot(0, self._flush_appium_refresh)
+    
+    def _flush_appium_refresh(self):
+        """执行合并后的Appium服务状态刷新"""
+        if not self._appium_dirty:
+            return
+        self._appium_dirty = False
+        self.refresh_appium_status()
+    
+    def _device_row_state_of(self, device: dict) -> tuple:
+        """计算设备行的显示内容
+        
+        :param device: 设备信息
+        :return: (型号, 系统版本, 状态, 电池, 内存, 存储) 文本元组
+        """
+        # 格式化存储信息显示
+        storage = device.get('storage', {})
+        if isinstance(storage, dict):
+            storage_text = (
+                f"总共: {storage.get('total', 'unknown')} | "
+                f"已用: {storage.get('used', 'unknown')} | "
+                f"可用: {storage.get('free', 'unknown')}"
+            )
+        else:
+            storage_text = str(storage)
+        
+        return tuple(device.get(field, 'unknown') for field in DEVICE_FIELDS) + (storage_text,)
+    
+    def _apply_device_row(self, item: QTreeWidgetItem, device_id: str, state: tuple,
+                          old_state: tuple = None):
+        """将行内容写入设备列表项，只写入与上次不同的列
+        
+        :param item: 设备列表项
+        :param device_id: 设备ID
+        :param state: _device_row_state_of 返回的文本元组
+        :param old_state: 上次写入的文本元组，为None表示新建的列表项
+        """
+        if old_state is None:
+            old_state = (None,) * len(state)
+        
+        for column, (text, old_text) in enumerate(zip(state, old_state), start=1):
+            if text != old_text:
+                item.setText(column, text)
+        
+        # 状态有任何变化都重新设置颜色和图标，其他状态（如 available）清除之前的样式，
+        # 避免复用的列表项残留旧样式
+        if state[2] != old_state[2]:
+            status = (state[2] or '').lower()
+            color, pixmap = STATUS_STYLES.get(status, NO_STATUS_STYLE)
+            item.setData(3, Qt.ItemDataRole.ForegroundRole, color)
+            item.setIcon(0, self._standard_icon(pixmap) if pixmap is not None else QIcon())
+        
+        # 型号、系统版本和状态都未变化时，提示信息不需要更新
+        if state[:3] == old_state[:3]:
+            return
+        
+        # 设置提示信息
+        tooltip = (
+            f"设备ID: {device_id}\n"
+            f"型号: {state[0]}\n"
+            f"系统版本: {state[1]}\n"
+            f"状态: {state[2]}"
+        )
+        for i in range(self.devices_tree.columnCount()):
+            item.setToolTip(i, tooltip)
+    
+    def _remove_device_item(self, device_id: str):
+        """从设备列表中移除指定设备"""
+        item = self._device_items.pop(device_id, None)
+        self._device_row_state.pop(device_id, None)
+        if item is not None:
+            index = self.devices_tree.indexOfTopLevelItem(item)
+            if index >= 0:
+                self.devices_tree.takeTopLevelItem(index)
+    
+    def _clear_device_items(self):
+        """清空设备列表及行缓存"""
+        self.devices_tree.clear()
+        self._device_items.clear()
+        self._device_row_state.clear()
+        self._last_devices_hash = None
+        self._connected_ids = frozenset()
     
     def _update_button_states(self):
         """更新按钮状态"""
@@ -356,12 +612,9 @@ class DeviceTab(QWidget):
             selected_items = self.devices_tree.selectedItems()
             has_selection = len(selected_items) > 0
             
-            # 获取设备和服务状态
-            devices = self.device_manager.get_devices()
-            servers = self.device_manager.get_appium_servers()
-            
-            connected_devices = sum(1 for d in devices if d.get('status', '').lower() == 'connected')
-            running_servers = len(servers)
+            # 使用最近一次刷新的结果，避免在界面线程中重复查询设备
+            connected_devices = len(self._connected_ids)
+            running_servers = self._server_count
             
             # 更新启动服务按钮状态
             self.start_btn.setEnabled(connected_devices > 0 and running_servers < connected_devices)
@@ -370,111 +623,156 @@ class DeviceTab(QWidget):
             self.stop_btn.setEnabled(running_servers > 0)
             
             # 更新右键菜单状态
-            if hasattr(self, 'context_menu'):
-                for action in self.context_menu.actions():
-                    if action.text() in ['连接设备', '断开设备', '刷新设备信息']:
-                        action.setEnabled(has_selection)
-                    elif action.text() == '启动Appium服务':
-                        action.setEnabled(has_selection and running_servers < connected_devices)
-                    elif action.text() == '停止Appium服务':
-                        action.setEnabled(has_selection and running_servers > 0)
+            if self.context_menu is not None:
+                self._act_connect.setEnabled(has_selection)
+                self._act_disconnect.setEnabled(has_selection)
+                self._act_refresh_device.setEnabled(has_selection)
+                self._act_start_appium.setEnabled(has_selection and running_servers < connected_devices)
+                self._act_stop_appium.setEnabled(has_selection and running_servers > 0)
         
         except Exception as e:
             logger.error(f"更新按钮状态失败: {e}")
     
     def refresh_appium_status(self):
         """刷新Appium服务状态"""
+        if self._refresh_paused():
+            return
         try:
             # 获取服务列表
             servers = self.device_manager.get_appium_servers()
-            
-            # 更新表格
-            self.appium_table.setRowCount(len(servers))
-            
-            for row, server in enumerate(servers):
-                # 主机
-                host_item = QTableWidgetItem(server.get('host', 'unknown'))
-                self.appium_table.setItem(row, 0, host_item)
-                
-                # 端口
-                port_item = QTableWidgetItem(str(server.get('port', 'unknown')))
-                self.appium_table.setItem(row, 1, port_item)
-                
-                # 运行时间
-                uptime = format_time(server.get('uptime', 0))
-                uptime_item = QTableWidgetItem(uptime)
-                self.appium_table.setItem(row, 2, uptime_item)
-                
-                # 状态
-                status = "运行中"
-                status_item = QTableWidgetItem(status)
-                status_item.setForeground(QColor('#4CAF50'))  # 绿色
-                self.appium_table.setItem(row, 3, status_item)
-            
-            logger.debug(f"Appium服务状态刷新完成，共 {len(servers)} 个服务")
-            
-            # 更新按钮状态
-            has_servers = len(servers) > 0
-            self.stop_btn.setEnabled(has_servers)
+            self._apply_appium_servers(servers)
         
         except Exception as e:
             logger.error(f"刷新Appium服务状态失败: {e}")
             self._show_error("错误", f"刷新Appium服务状态失败: {e}")
     
-    def _connect_device(self, item):
+    def _apply_appium_servers(self, servers: list):
+        """将Appium服务列表差异更新到表格
+        
+        按(主机, 端口)与上一次的结果比较，只增删变化的行，
+        已存在的行只更新运行时间
+        
+        :param servers: 服务信息列表
+        """
+        rows = [
+            (
+                (server.get('host', 'unknown'), str(server.get('port', 'unknown'))),
+                format_time(server.get('uptime', 0)),
+            )
+            for server in servers
+        ]
+        new_keys = {key for key, _ in rows}
+        
+        # 内容没有任何变化时不触碰表格，避免无谓的重绘
+        if len(rows) == len(self._appium_row_state) and all(
+            self._appium_row_state.get(key) == uptime for key, uptime in rows
+        ):
+            self._server_count = len(servers)
+            self._update_button_states()
+            return
+        
+        # 批量修改期间暂停重绘；表格没有监听 itemChanged，同时屏蔽信号
+        updates_enabled = self.appium_table.updatesEnabled()
+        self.appium_table.setUpdatesEnabled(False)
+        self.appium_table.blockSignals(True)
+        try:
+            # 移除已停止的服务
+            for key in self._appium_row_items.keys() - new_keys:
+                items = self._appium_row_items.pop(key)
+                self._appium_row_state.pop(key, None)
+                self.appium_table.removeRow(self.appium_table.row(items[0]))
+            
+            # 新增服务或更新运行时间
+            for key, uptime in rows:
+                items = self._appium_row_items.get(key)
+                if items is None:
+                    host, port = key
+                    status_item = QTableWidgetItem("运行中")
+                    status_item.setForeground(RUNNING_COLOR)
+                    items = (
+                        QTableWidgetItem(host),
+                        QTableWidgetItem(port),
+                        QTableWidgetItem(uptime),
+                        status_item,
+                    )
+                    row = self.appium_table.rowCount()
+                    self.appium_table.insertRow(row)
+                    for column, item in enumerate(items):
+                        # 表格只用于展示，右键菜单依赖端口文本，禁止编辑
+                        item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
+                        self.appium_table.setItem(row, column, item)
+                    self._appium_row_items[key] = items
+                elif self._appium_row_state.get(key) != uptime:
+                    items[2].setText(uptime)
+                self._appium_row_state[key] = uptime
+        finally:
+            self.appium_table.blockSignals(False)
+            self.appium_table.setUpdatesEnabled(updates_enabled)
+        
+        self._server_count = len(servers)
+        logger.debug(f"Appium服务状态刷新完成，共 {len(servers)} 个服务")
+        
+        # 更新按钮状态
+        self._update_button_states()
+    
+    def _connect_device(self, device_id: str):
         """连接设备"""
         try:
-            device_id = item.text(0)
-            asyncio.create_task(self.device_manager.connect_device(device_id))
+            self._submit(
+                self.device_manager.connect_device(device_id),
+                self._on_device_action_done
+            )
             logger.info(f"正在连接设备: {device_id}")
         except Exception as e:
             logger.error(f"连接设备失败: {e}")
             self._show_error("错误", f"连接设备失败: {e}")
     
-    def _disconnect_device(self, item):
+    def _disconnect_device(self, device_id: str):
         """断开设备连接"""
         try:
-            device_id = item.text(0)
-            asyncio.create_task(self.device_manager.disconnect_device(device_id))
+            self._submit(
+                self.device_manager.disconnect_device(device_id),
+                self._on_device_action_done
+            )
             logger.info(f"正在断开设备: {device_id}")
         except Exception as e:
             logger.error(f"断开设备失败: {e}")
             self._show_error("错误", f"断开设备失败: {e}")
     
-    def _start_appium_for_device(self, item):
+    def _start_appium_for_device(self, device_id: str):
         """为设备启动Appium服务"""
         try:
-            device_id = item.text(0)
             port = get_free_port()
-            asyncio.create_task(
-                self.device_manager.start_appium_server_async(port=port)
+            self._submit(
+                self.device_manager.start_appium_server_async(port=port),
+                self._on_appium_action_done
             )
             logger.info(f"正在为设备 {device_id} 启动Appium服务")
         except Exception as e:
             logger.error(f"启动Appium服务失败: {e}")
             self._show_error("错误", f"启动Appium服务失败: {e}")
     
-    def _stop_appium_for_device(self, item):
+    def _stop_appium_for_device(self, device_id: str):
         """停止设备的Appium服务"""
         try:
-            device_id = item.text(0)
             device_info = self.device_manager.get_device_info(device_id)
             if device_info and 'appium_port' in device_info:
                 port = device_info['appium_port']
-                asyncio.create_task(
-                    self.device_manager.stop_appium_server_async(port)
+                self._submit(
+                    self.device_manager.stop_appium_server_async(port),
+                    self._on_appium_action_done
                 )
                 logger.info(f"正在停止设备 {device_id} 的Appium服务")
         except Exception as e:
             logger.error(f"停止Appium服务失败: {e}")
             self._show_error("错误", f"停止Appium服务失败: {e}")
     
-    def _refresh_device(self, item):
+    def _refresh_device(self, device_id: str):
         """刷新单个设备信息"""
         try:
-            device_id = item.text(0)
             device_info = self.device_manager.get_device_info(device_id)
-            if device_info:
+            item = self._device_items.get(device_id)
+            if device_info and item is not None:
                 self._update_device_item(item, device_info)
                 logger.info(f"设备 {device_id} 信息已刷新")
         except Exception as e:
@@ -484,31 +782,12 @@ class DeviceTab(QWidget):
     def _update_device_item(self, item: QTreeWidgetItem, device_info: dict):
         """更新设备列表项"""
         try:
-            item.setText(1, device_info.get('model', 'unknown'))
-            item.setText(2, device_info.get('platform_version', 'unknown'))
-            item.setText(3, device_info.get('status', 'unknown'))
-            item.setText(4, device_info.get('battery', 'unknown'))
-            item.setText(5, device_info.get('memory', 'unknown'))
-            
-            storage = device_info.get('storage', {})
-            if isinstance(storage, dict):
-                storage_text = (
-                    f"总共: {storage.get('total', 'unknown')} | "
-                    f"已用: {storage.get('used', 'unknown')} | "
-                    f"可用: {storage.get('free', 'unknown')}"
-                )
-            else:
-                storage_text = str(storage)
-            item.setText(6, storage_text)
-            
-            # 更新状态颜色
-            status = device_info.get('status', '').lower()
-            if status == 'connected':
-                item.setForeground(3, QColor('#4CAF50'))
-            elif status == 'disconnected':
-                item.setForeground(3, QColor('#F44336'))
-            elif status == 'error':
-                item.setForeground(3, QColor('#FF9800'))
+            device_id = item.text(0)
+            state = self._device_row_state_of(device_info)
+            old_state = self._device_row_state.get(device_id)
+            if old_state != state:
+                self._apply_device_row(item, device_id, state, old_state)
+                self._device_row_state[device_id] = state
         
         except Exception as e:
             logger.error(f"更新设备列表项失败: {e}")
@@ -517,8 +796,9 @@ class DeviceTab(QWidget):
         """停止指定的Appium服务"""
         try:
             port = int(self.appium_table.item(row, 1).text())
-            asyncio.create_task(
-                self.device_manager.stop_appium_server_async(port)
+            self._submit(
+                self.device_manager.stop_appium_server_async(port),
+                self._on_appium_action_done
             )
             logger.info(f"正在停止端口 {port} 的Appium服务")
         except Exception as e:
@@ -538,7 +818,7 @@ class DeviceTab(QWidget):
                     host=host, port=port
                 )
             
-            asyncio.create_task(restart())
+            self._submit(restart(), self._on_appium_action_done)
             logger.info(f"正在重启端口 {port} 的Appium服务")
         
         except Exception as e:
@@ -564,65 +844,67 @@ class DeviceTab(QWidget):
     def start_all_appium_servers(self):
         """启动所有Appium服务"""
         try:
-            # 获取设备列表
-            devices = self.device_manager.get_devices()
-            if not devices:
+            # 使用最近一次轮询得到的设备列表，不在界面线程中重新枚举设备
+            count = len(self._device_items)
+            if not count:
                 self._show_error("错误", "没有可用的设备")
                 return
             
-            # 创建事件循环
-            loop = asyncio.new_event_loop()
-            
-            async def start_servers():
-                tasks = []
-                for device in devices:
-                    # 获取空闲端口
-                    port = get_free_port()
-                    if not port:
-                        logger.error("无法获取空闲端口")
-                        continue
-                    
-                    # 创建启动任务
-                    task = self.device_manager.start_appium_server_async(
-                        host='127.0.0.1',
-                        port=port
-                    )
-                    tasks.append(task)
-                
-                # 等待所有任务完成
-                if tasks:
-                    results = await asyncio.gather(*tasks, return_exceptions=True)
-                    # 处理结果
-                    for i, result in enumerate(results):
-                        if isinstance(result, Exception):
-                            logger.error(f"启动Appium服务失败: {result}")
-                        elif not result:
-                            logger.error(f"启动Appium服务失败")
-                    
-                    # 在主线程中刷新服务状态
-                    QTimer.singleShot(0, self.refresh_appium_status)
-            
-            # 在新线程中运行事件循环
-            def run_async():
-                try:
-                    asyncio.set_event_loop(loop)
-                    loop.run_until_complete(start_servers())
-                except Exception as e:
-                    logger.error(f"启动Appium服务失败: {e}")
-                finally:
-                    loop.close()
-            
-            thread = threading.Thread(target=run_async)
-            thread.daemon = True  # 设置为守护线程
-            thread.start()
+            self._submit(self._start_servers(count), self._on_start_servers_complete)
+            logger.info("正在启动所有Appium服务")
             
         except Exception as e:
             logger.error(f"启动所有Appium服务失败: {e}")
             self._show_error("错误", f"启动所有Appium服务失败: {e}")
     
+    async def _start_servers(self, count: int) -> int:
+        """为每台设备启动一个Appium服务
+        
+        :param count: 设备数量
+        :return: 启动失败的服务数量
+        """
+        # 一次扫描分配互不相同的端口，逐个调用 get_free_port 会重复拿到同一个端口
+        ports = get_free_ports(count)
+        failed = count - len(ports)
+        
+        # 创建启动任务
+        tasks = [
+            self.device_manager.start_appium_server_async(host='127.0.0.1', port=port)
+            for port in ports
+        ]
+        
+        # 等待所有任务完成，限制同时启动的服务数量
+        results = await _gather_limited(tasks)
+        for result in results:
+            if isinstance(result, Exception):
+                failed += 1
+                logger.error(f"启动Appium服务失败: {result}")
+            elif not result:
+                failed += 1
+                logger.error(f"启动Appium服务失败")
+        return failed
+    
+    def _on_start_servers_complete(self, future):
+        """启动服务完成后的处理"""
+        error = future.exception()
+        if error is not None:
+            logger.error(f"启动所有Appium服务失败: {error}")
+            self._show_error("错误", f"启动所有Appium服务失败: {error}")
+        elif future.result():
+            self._show_error("错误", f"{future.result()} 个Appium服务启动失败，详情请查看日志")
+        
+        # 刷新服务状态
+        self._schedule_refresh_appium()
+    
     def stop_all_appium_servers(self):
-        """停止所有Appium服务"""
+        """停止所有Appium服务
+        
+        在后台事件循环中并发停止，期间暂停列表刷新，全部完成后刷新一次
+        """
         try:
+            if self._bulk_op:
+                return
+            
             # 获取所有运行中的Appium服务
             servers = self.device_manager.get_appium_servers()
             if not servers:
@@ -633,107 +915,240 @@ class DeviceTab(QWidget):
             self.stop_btn.setEnabled(False)
             self.start_btn.setEnabled(False)
             
-            # 创建事件循环
-            loop = asyncio.new_event_loop()
-            
-            async def stop_servers():
-                try:
-                    tasks = []
-                    for server in servers:
-                        # 创建停止任务
-                        task = self.device_manager.stop_appium_server_async(
-                            server['port']
-                        )
-                        tasks.append(task)
-                    
-                    # 等待所有任务完成
-                    if tasks:
-                        results = await asyncio.gather(*tasks, return_exceptions=True)
-                        # 处理结果
-                        for i, result in enumerate(results):
-                            if isinstance(result, Exception):
-                                logger.error(f"停止Appium服务失败: {result}")
-                            elif not result:
-                                logger.error(f"停止Appium服务失败")
-                except Exception as e:
-                    logger.error(f"停止服务失败: {e}")
-                finally:
-                    # 使用QTimer在主线程中更新UI
-                    QTimer.singleShot(0, self._on_stop_servers_complete)
-            
-            # 在新线程中运行事件循环
-            def run_async():
-                try:
-                    asyncio.set_event_loop(loop)
-                    loop.run_until_complete(stop_servers())
-                except Exception as e:
-                    logger.error(f"停止Appium服务失败: {e}")
-                finally:
-                    loop.close()
-            
-            thread = threading.Thread(target=run_async)
-            thread.daemon = True  # 设置为守护线程
-            thread.start()
+            self._bulk_op = True
+            self._stop_future = self._submit(
+                self._stop_servers([server['port'] for server in servers]),
+                self._on_stop_servers_complete
+            )
             
             logger.info("正在停止所有Appium服务")
         
         except Exception as e:
+            self._bulk_op = False
+            self._stop_future = None
             logger.error(f"停止所有Appium服务失败: {e}")
             self._show_error("错误", f"停止所有Appium服务失败: {e}")
             self.stop_btn.setEnabled(True)
             self.start_btn.setEnabled(True)
     
-    def _on_stop_servers_complete(self):
+    async def _stop_servers(self, ports: list) -> int:
+        """并发停止多个Appium服务
+        
+        :param ports: 服务端口列表
+        :return: 停止失败的服务数量
+        """
+        results = await _gather_limited(
+            [self.device_manager.stop_appium_server_async(port) for port in ports]
+        )
+        failed = 0
+        for port, result in zip(ports, results):
+            if isinstance(result, Exception):
+                failed += 1
+                logger.error(f"停止端口 {port} 的Appium服务失败: {result}")
+        return failed
+    
+    def _on_stop_servers_complete(self, future):
         """停止服务完成后的处理"""
+        self._stop_future = None
+        self._bulk_op = False
         try:
-            # 刷新服务状态
+            # 刷新服务状态，同时更新按钮状态
             self.refresh_appium_status()
             
-            # 重新启用按钮
-            self.stop_btn.setEnabled(True)
-            self.start_btn.setEnabled(True)
-            
-            logger.info("所有Appium服务已停止")
+            error = future.exception()
+            if error is not None:
+                self._show_error("错误", f"停止所有Appium服务失败: {error}")
+            elif future.result():
+                self._show_error("错误", f"{future.result()} 个Appium服务停止失败，详情请查看日志")
+            else:
+                logger.info("所有Appium服务已停止")
         except Exception as e:
             logger.error(f"更新UI状态失败: {e}")
             self._show_error("错误", f"更新UI状态失败: {e}")
     
+    def _on_device_action_done(self, future):
+        """设备连接/断开完成后的处理"""
+        error = future.exception()
+        if error is not None:
+            logger.error(f"设备操作失败: {error}")
+            self._show_error("错误", f"设备操作失败: {error}")
+        
+        # 连接状态已变化，重新枚举设备
+        self.device_manager.clear_cache()
+        self._schedule_refresh_devices()
+    
+    def _on_appium_action_done(self, future):
+        """单个Appium服务操作完成后的处理"""
+        error = future.exception()
+        if error is not None:
+            logger.error(f"Appium服务操作失败: {error}")
+            self._show_error("错误", f"Appium服务操作失败: {error}")
+        self._schedule_refresh_appium()
+    
+    def _run_aio_loop(self):
+        """后台线程：运行常驻事件循环"""
+        asyncio.set_event_loop(self._aio_loop)
+        self._aio_loop.run_forever()
+    
+    def _submit(self, coro, on_done=None):
+        """将协程提交到后台事件循环执行
+        
+        :param coro: 协程
+        :param on_done: 完成后在界面线程中调用的回调，参数为 Future
+        :return: concurrent.futures.Future
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self._aio_loop)
+        if on_done is not None:
+            future.add_done_callback(
+                lambda f: self._async_signals.done.emit(on_done, f)
+            )
+        return future
+    
+    def _on_async_done(self, callback, future):
+        """后台协程完成，在界面线程中执行回调"""
+        try:
+            callback(future)
+        except Exception as e:
+            logger.error(f"处理异步操作结果失败: {e}")
+    
     def _show_error(self, title: str, message: str):
         """显示错误对话框"""
-        QMessageBox.critical(
-            self,
-            title,
-            message,
-            QMessageBox.StandardButton.Ok
-        )
+        self._show_nonmodal(QMessageBox.Icon.Critical, title, message)
+    
+    def _show_nonmodal(self, icon, title: str, text: str):
+        """显示非模态消息框，不阻塞事件循环，关闭后自动释放
+        
+        :param icon: 消息框图标
+        :param title: 标题
+        :param text: 内容
+        :return: 消息框
+        """
+        msg = QMessageBox(icon, title, text, QMessageBox.StandardButton.Ok, self)
+        msg.setWindowModality(Qt.WindowModality.NonModal)
+        msg.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        msg.show()
+        return msg
     
-    def _start_refresh_timer(self):
-        """启动刷新定时器"""
+    def _create_refresh_timer(self):
+        """创建刷新定时器
+        
+        定时器在 showEvent 中启动、hideEvent 中停止，
+        标签页不可见时不轮询设备
+        """
         try:
             self.refresh_timer = QTimer()
-            self.refresh_timer.timeout.connect(self._refresh_all)
-            self.refresh_timer.start(self.refresh_interval)
-            logger.info("刷新定时器已启动")
+            # 轮询不需要毫秒级精度，使用粗粒度定时器减少系统唤醒
+            self.refresh_timer.setTimerType(Qt.TimerType.CoarseTimer)
+            self.refresh_timer.setInterval(self.refresh_interval)
+            self.refresh_timer.timeout.connect(self._kick_poll)
+            logger.info("刷新定时器已创建")
         except Exception as e:
-            logger.error(f"启动刷新定时器失败: {e}")
+            logger.error(f"创建刷新定时器失败: {e}")
+    
+    def showEvent(self, event):
+        """标签页显示时立即刷新一次并启动定时刷新"""
+        super().showEvent(event)
+        if (self.refresh_timer and not self.refresh_timer.isActive()
+                and not self._shutting_down):
+            self.refresh_timer.start()
+            self._kick_poll()
     
-    def _refresh_all(self):
-        """刷新所有状态"""
+    def hideEvent(self, event):
+        """标签页隐藏时停止定时刷新"""
+        super().hideEvent(event)
+        if self.refresh_timer:
+            self.refresh_timer.stop()
+    
+    def _kick_poll(self):
+        """在线程池中轮询设备和服务状态，上一次轮询未完成时跳过本次"""
         try:
-            self.refresh_devices()
-            self.refresh_appium_status()
+            if self._poll_task is not None or self._refresh_paused():
+                return
+            
+            task = _DevicePollTask(self.device_manager)
+            task.signals.finished.connect(
+                self._apply_poll_result, Qt.ConnectionType.QueuedConnection
+            )
+            task.signals.failed.connect(
+                self._on_poll_failed, Qt.ConnectionType.QueuedConnection
+            )
+            self._poll_task = task
+            self.pool.start(task)
         except Exception as e:
+            self._poll_task = None
             logger.error(f"刷新状态失败: {e}")
+            self._finish_manual_refresh(f"刷新设备列表失败: {e}")
     
-    def __del__(self):
-        """清理资源"""
+    def _apply_poll_result(self, devices: list, servers: list):
+        """轮询完成，在界面线程中更新列表
+        
+        设备列表内容未变化时跳过树形列表的更新
+        
+        :param devices: 设备信息列表
+        :param servers: Appium服务信息列表
+        """
+        self._poll_task = None
+        if self._refresh_paused():
+            self._repoll_pending = False
+            self._finish_manual_refresh()
+            return
+        try:
+            rows = self._device_rows(devices)
+            rows_hash = hash(rows)
+            if rows_hash != self._last_devices_hash:
+                self._apply_devices(rows, rows_hash)
+            self._apply_appium_servers(servers)
+            if self._repoll_if_pending():
+                return
+            self._finish_manual_refresh(count=len(devices))
+        except Exception as e:
+            logger.error(f"刷新状态失败: {e}")
+            self._finish_manual_refresh(f"刷新设备列表失败: {e}")
+    
+    def _on_poll_failed(self, message: str):
+        """轮询失败，只有手动刷新时提示错误"""
+        self._poll_task = None
+        if self._refresh_paused():
+            self._repoll_pending = False
+        elif self._repoll_if_pending():
+            return
+        self._finish_manual_refresh(f"刷新设备列表失败: {message}")
+    
+    def _repoll_if_pending(self) -> bool:
+        """轮询期间收到过刷新请求时再轮询一次，手动刷新的按钮状态留到这次轮询结束再恢复
+        
+        :return: 是否已开始新的轮询
+        """
+        if not self._repoll_pending:
+            return False
+        self._repoll_pending = False
+        self._kick_poll()
+        return self._poll_task is not None
+    
+    def _refresh_paused(self) -> bool:
+        """批量操作进行中或应用正在退出时暂停刷新"""
+        return self._bulk_op or self._shutting_down
+    
+    def shutdown(self):
+        """清理资源，在应用退出前调用，多次调用只清理一次"""
+        if self._shutting_down:
+            return
+        self._shutting_down = True
         try:
             if self.refresh_timer:
                 self.refresh_timer.stop()
+            
+            # 等待正在进行的批量停止完成，避免退出时遗留Appium进程
+            if self._stop_future is not None:
+                try:
+                    self._stop_future.result(timeout=10)
+                except Exception as e:
+                    logger.error(f"等待Appium服务停止失败: {e}")
+            self._aio_loop.call_soon_threadsafe(self._aio_loop.stop)
             logger.info("设备标签页资源已清理")
             
         except Exception as e:
-            logger.error(f"清理资源失败: {e}") 
+            logger.error(f"清理资源失败: {e}")
     
     def set_platform(self, platform: str):
         """设置当前平台
@@ -744,10 +1159,12 @@ class DeviceTab(QWidget):
         try:
             if platform != self.current_platform:
                 self.current_platform = platform.lower()
+                # 切换设备管理器的平台，同时使设备缓存失效
+                self.device_manager.set_platform(self.current_platform)
                 # 清空设备列表
-                self.devices_tree.clear()
+                self._clear_device_items()
                 # 刷新设备列表
-                self.refresh_devices()
+                self._schedule_refresh_devices()
                 logger.info(f"已切换到 {platform} 平台")
         except Exception as e:
             logger.error(f"设置平台失败: {e}")
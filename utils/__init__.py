@@ -26,6 +26,7 @@ from .errors import (
 
 from .helpers import (
     get_free_port,
+    get_free_ports,
     kill_process_by_port,
     is_port_in_use,
     ensure_dir_exists,
@@ -64,6 +65,7 @@ __all__ = [
     
     # 辅助函数
     'get_free_port',
+    'get_free_ports',
     'kill_process_by_port',
     'is_port_in_use',
     'ensure_dir_exists',
@@ -3,6 +3,8 @@
 此模块提供配置的加载、保存和验证功能。
 """
 
+import json
+import mmap
 import os
 from typing import Dict, Optional
 from .constants import (
@@ -12,6 +14,34 @@ from .constants import (
 from .errors import ConfigError
 from .logger import logger
 
+try:
+    import orjson
+except ImportError:  # 未安装 orjson 时退回标准库 json
+    orjson = None
+
+
+def _read_json_file(file_path: str) -> Dict:
+    """读取并解析 JSON 文件。
+
+    超过一页的文件在 orjson 可用时通过 mmap 直接解析，省去读入 bytes 的拷贝。
+
+    Args:
+        file_path: 文件路径
+
+    Returns:
+        解析后的数据
+    """
+    with open(file_path, 'rb') as f:
+        # mmap 不支持空文件；标准库 json 无法直接解析 mmap，只在 orjson 可用时启用
+        if orjson is not None and os.fstat(f.fileno()).st_size >= mmap.PAGESIZE:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 class Config:
     """配置管理类。"""
 
@@ -40,9 +70,7 @@ class Config:
                 logger.info(f"已创建用户配置文件: {self.config_file}")
 
             # 加载配置文件
-            import json
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                self.config = json.load(f)
+            self.config = _read_json_file(self.config_file)
 
             # 验证并补充配置
             self._validate_config()
@@ -60,7 +88,6 @@ class Config:
             os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
 
             # 保存配置
-            import json
             with open(self.config_file, 'w', encoding='utf-8') as f:
                 json.dump(self.config, f, ensure_ascii=False, indent=2)
 
@@ -124,9 +151,7 @@ class Config:
             if not os.path.exists(DEFAULT_CONFIG_FILE):
                 raise ConfigError(f"默认配置文件不存在: {DEFAULT_CONFIG_FILE}")
 
-            import json
-            with open(DEFAULT_CONFIG_FILE, 'r', encoding='utf-8') as f:
-                self.config = json.load(f)
+            self.config = _read_json_file(DEFAULT_CONFIG_FILE)
 
             self._supplement_config()
             self.save_config()
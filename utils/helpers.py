@@ -239,11 +239,29 @@ def get_free_port(start_port: int = 4723, end_port: int = 4823, exclude_ports: L
     :param exclude_ports: 要排除的端口列表
     :return: 空闲端口号或None
     """
-    if exclude_ports is None:
-        exclude_ports = []
+    ports = get_free_ports(1, start_port, end_port, exclude_ports)
+    if not ports:
+        return None
+    logger.debug(f"找到空闲端口: {ports[0]}")
+    return ports[0]
+
+def get_free_ports(count: int, start_port: int = 4723, end_port: int = 4823, exclude_ports: List[int] = None) -> List[int]:
+    """
+    一次扫描获取多个互不相同的空闲端口
+    连续调用 get_free_port 在端口真正被占用前会重复返回同一个端口，批量启动服务时应使用此函数
+    :param count: 需要的端口数量
+    :param start_port: 起始端口号
+    :param end_port: 结束端口号
+    :param exclude_ports: 要排除的端口列表
+    :return: 空闲端口列表，空闲端口不足时返回的数量少于count
+    """
+    exclude = set(exclude_ports or ())
+    ports = []
     
     for port in range(start_port, end_port + 1):
-        if port in exclude_ports:
+        if len(ports) >= count:
+            break
+        if port in exclude:
             continue
         
         try:
@@ -254,13 +272,13 @@ def get_free_port(start_port: int = 4723, end_port: int = 4823, exclude_ports: L
             # 尝试绑定端口
             with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
                 s.bind(('', port))
-                logger.debug(f"找到空闲端口: {port}")
-                return port
+                ports.append(port)
         except OSError:
             continue
     
-    logger.error("未找到空闲端口")
-    return None
+    if len(ports) < count:
+        logger.error(f"空闲端口不足: 需要 {count} 个，找到 {len(ports)} 个")
+    return ports
 
 def format_time(seconds: float) -> str:
     """
@@ -268,9 +286,8 @@ def format_time(seconds: float) -> str:
     :param seconds: 秒数
     :return: 格式化后的时间字符串
     """
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    seconds = int(seconds % 60)
+    hours, rest = divmod(int(seconds), 3600)
+    minutes, seconds = divmod(rest, 60)
     
     if hours > 0:
         return f"{hours:02d}:{minutes:02d}:{seconds:02d}"